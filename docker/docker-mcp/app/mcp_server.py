@@ -27,14 +27,18 @@ For POC/testing only. Localhost-only binding.
 Port: 8081 (calls Flask on 8080)
 """
 
+import asyncio
+import functools
+import inspect
 import json
 import logging
 import os
-import base64
+import binascii
 import io
 from pathlib import Path
 from typing import Optional, Dict, Any
 import httpx
+from pydantic import PrivateAttr
 
 from mcp.server.models import InitializationOptions
 import mcp.types as types
@@ -44,6 +48,14 @@ try:
     from mcp.server.fastmcp import FastMCP
 except Exception:  # pragma: no cover - compatibility fallback for older SDKs
     FastMCP = None
+try:
+    import uvloop
+except ImportError:  # optional: not installed on armv6l (no wheel)
+    uvloop = None
+try:
+    import orjson
+except ImportError:  # optional: not installed on armv6l (no wheel)
+    orjson = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -51,6 +63,15 @@ logger = logging.getLogger(__name__)
 # Flask API base URL (localhost by default; can be overridden for distributed setups)
 FLASK_API_BASE = os.getenv("FLASK_API_BASE", "http://localhost:8080")
 
+# Response parser: orjson when available (raises a ValueError subclass either way)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Read size for streamed image downloads
+IMAGE_STREAM_CHUNK = 64 * 1024
+
+# Base64 work on payloads this large runs on a worker thread, off the event loop
+CPU_OFFLOAD_BYTES = 256 * 1024
+
 # Data directory for logs
 DATA_DIR = Path(__file__).parents[1] / "data"
 DATA_DIR.mkdir(exist_ok=True)
@@ -69,8 +90,21 @@ logger.info("==================================================")
 _api_client: Optional[httpx.AsyncClient] = None
 
 
+class _PayloadText(TextContent):
+    """TextContent that keeps the dict it was serialized from.
+
+    The legacy transport sends `text`; FastMCP wrappers read the dict back
+    directly instead of re-parsing the JSON they were just given.
+    """
+
+    _payload: Optional[dict] = PrivateAttr(default=None)
+
+
 def _tool_text(payload: dict) -> list[TextContent]:
-    return [TextContent(type="text", text=json.dumps(payload, indent=2))]
+    # Compact on purpose: indent= forces json's pure-Python encoder
+    content = _PayloadText(type="text", text=json.dumps(payload, separators=(",", ":")))
+    content._payload = payload
+    return [content]
 
 
 def _tool_error(message: str, *, hint: Optional[str] = None, details: Optional[dict] = None) -> list[TextContent]:
@@ -89,7 +123,14 @@ async def _get_api_client() -> httpx.AsyncClient:
             base_url=FLASK_API_BASE,
             headers={"Accept": "application/json"},
             timeout=httpx.Timeout(30.0, connect=5.0),
-            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            # Single upstream: keep idle loopback connections for minutes rather
+            # than httpx's 5s default so sparse tool calls skip TCP setup.
+            # (Flask's werkzeug server is HTTP/1.1-only, so no http2.)
+            limits=httpx.Limits(
+                max_keepalive_connections=10,
+                max_connections=20,
+                keepalive_expiry=300.0,
+            ),
         )
     return _api_client
 
@@ -107,15 +148,24 @@ async def _api_json(
     *,
     json_body: Optional[dict] = None,
     files: Optional[dict] = None,
+    form_data: Optional[dict] = None,
     timeout: Optional[float] = None,
 ) -> dict:
     client = await _get_api_client()
-    response = await client.request(method, path, json=json_body, files=files, timeout=timeout)
+    response = await client.request(
+        method, path, json=json_body, files=files, data=form_data, timeout=timeout
+    )
 
-    try:
-        data = response.json()
-    except ValueError as exc:
-        raise RuntimeError(f"Invalid JSON response from Flask API: {path}") from exc
+    raw = response.content
+    if not raw:
+        data = {}  # empty body (e.g. 204): nothing to scan
+    elif not response.is_success and "json" not in response.headers.get("content-type", ""):
+        data = None  # HTML/text error page: report the status, skip the parse
+    else:
+        try:
+            data = _json_loads(raw)  # bytes in: no text decode step
+        except ValueError as exc:
+            raise RuntimeError(f"Invalid JSON response from Flask API: {path}") from exc
 
     if not response.is_success:
         message = data.get("error") if isinstance(data, dict) else None
@@ -134,6 +184,8 @@ async def _api_json(
 def _safe_int(value: Any, field: str, default: int) -> int:
     if value is None:
         return default
+    if type(value) is int:  # JSON ints: skip the try/except path
+        return value
     try:
         return int(value)
     except (TypeError, ValueError) as exc:
@@ -143,6 +195,8 @@ def _safe_int(value: Any, field: str, default: int) -> int:
 def _safe_float(value: Any, field: str, default: float) -> float:
     if value is None:
         return default
+    if type(value) is float:  # JSON numbers: skip the try/except path
+        return value
     try:
         return float(value)
     except (TypeError, ValueError) as exc:
@@ -152,7 +206,7 @@ def _safe_float(value: Any, field: str, default: float) -> float:
 def _safe_bool(value: Any, default: bool) -> bool:
     if value is None:
         return default
-    if isinstance(value, bool):
+    if value is True or value is False:
         return value
     if isinstance(value, (int, float)):
         return value != 0
@@ -161,6 +215,13 @@ def _safe_bool(value: Any, default: bool) -> bool:
     return bool(value)
 
 
+def _form_field(value: Any) -> str:
+    """Multipart form value; bools go as "true"/"false", not str(bool)."""
+    if value is True or value is False:
+        return "true" if value else "false"
+    return str(value)
+
+
 # ==============================================================================
 # TOOLS
 # ==============================================================================
@@ -200,6 +261,13 @@ async def list_tools() -> list[Tool]:
                     "image_base64": {
                         "type": "string",
                         "description": "Base64 PNG data (if image_name='custom')"
+                    },
+                    "embed": {
+                        "type": "boolean",
+                        "description": (
+                            "Include base64 image data for samples (default: true); "
+                            "false returns metadata only"
+                        )
                     }
                 },
                 "required": []
@@ -399,6 +467,47 @@ async def tool_get_status() -> list[TextContent]:
         return _tool_error(str(e))
 
 
+def _header_int(headers: httpx.Headers, name: str) -> Optional[int]:
+    """Parse an integer response header, or None if missing/invalid."""
+    try:
+        return int(headers[name])
+    except (KeyError, ValueError):
+        return None
+
+
+def _png_data_url(img_bytes) -> str:
+    """Wrap PNG bytes (any bytes-like) as a base64 data URL with one decode."""
+    encoded = binascii.b2a_base64(memoryview(img_bytes), newline=False)
+    return b"".join((b"data:image/png;base64,", encoded)).decode("ascii")
+
+
+def _decode_image_base64(image_base64: str) -> bytes:
+    """Decode raw base64 or a data URL.
+
+    a2b_base64 takes the ASCII str as-is (no encode copy); non-ASCII or
+    malformed input raises ValueError, which tool_burn_job reports.
+    """
+    start = 0
+    if image_base64.startswith("data:image"):
+        start = image_base64.find(",") + 1
+        if start == 0:
+            raise ValueError("Malformed data URL: missing ',' before base64 payload")
+    if len(image_base64) - start < 4:
+        raise ValueError("image_base64 payload is empty or truncated")
+    return binascii.a2b_base64(image_base64[start:] if start else image_base64)
+
+
+async def _run_cpu(fn, data):
+    """Run fn(data) inline when small, via asyncio.to_thread when large.
+
+    Threadpool hand-off costs more than encoding a small image; multi-MB
+    payloads would otherwise stall every other MCP session on the loop.
+    """
+    if len(data) < CPU_OFFLOAD_BYTES:
+        return fn(data)
+    return await asyncio.to_thread(fn, data)
+
+
 async def tool_load_image(arguments: dict) -> list[TextContent]:
     """Load image (sample or custom base64) via Flask API."""
     try:
@@ -417,31 +526,32 @@ async def tool_load_image(arguments: dict) -> list[TextContent]:
                 "note": "Custom image ready for burn"
             }
         else:
-            # Load sample image via Flask API
+            # Load sample image via Flask API (metadata-only callers skip the body)
+            embed = arguments.get("embed", True) is not False
             client = await _get_api_client()
-            img_response = await client.get(f"/api/images/serve/{image_name}", timeout=10.0)
+            img_bytes = bytearray()
+            async with client.stream(
+                "GET" if embed else "HEAD", f"/api/images/serve/{image_name}", timeout=10.0
+            ) as img_response:
+                if img_response.is_success and embed:
+                    async for chunk in img_response.aiter_bytes(IMAGE_STREAM_CHUNK):
+                        img_bytes += chunk
             if not img_response.is_success:
                 return _tool_error(f"Image not found: {image_name}")
 
-            # Convert to base64
-            img_bytes = img_response.content
-            b64 = base64.b64encode(img_bytes).decode("utf-8")
-            data_url = f"data:image/png;base64,{b64}"
-
-            # Get image info from PIL
-            from PIL import Image
-            img = Image.open(io.BytesIO(img_bytes))
-
+            # Image info comes from Flask response headers (no decode here)
+            headers = img_response.headers
             result = {
                 "success": True,
                 "source": "sample",
                 "filename": image_name,
-                "width": img.width,
-                "height": img.height,
-                "mode": img.mode,
-                "image_base64": data_url,
+                "width": _header_int(headers, "X-Image-Width"),
+                "height": _header_int(headers, "X-Image-Height"),
+                "mode": headers.get("X-Image-Mode"),
                 "api_endpoint": f"/api/images/serve/{image_name}",
             }
+            if embed:
+                result["image_base64"] = await _run_cpu(_png_data_url, img_bytes)
         
         return _tool_text(result)
     
@@ -499,32 +609,42 @@ async def tool_burn_job(arguments: dict) -> list[TextContent]:
         if burn_request["center_y"] is not None:
             burn_request["center_y"] = _safe_int(arguments.get("center_y"), "center_y", 0)
         
-        # If image_base64 provided, call prepare first
+        # If image_base64 provided, upload it with the burn params in one
+        # multipart request (no separate /api/engrave/prepare round-trip)
         image_base64 = arguments.get("image_base64", "")
         if image_base64 and not burn_request["temp_path"]:
-            # Call /api/engrave/prepare to get temp_path
-            if image_base64.startswith("data:image"):
-                image_base64 = image_base64.split(",", 1)[1]
-            img_bytes = base64.b64decode(image_base64)
-            files = {"image": ("mcp_upload.png", io.BytesIO(img_bytes), "image/png")}
-            prepare_data = await _api_json(
+            image_bytes = await _run_cpu(_decode_image_base64, image_base64)
+            files = {"image": ("mcp_upload.png", io.BytesIO(image_bytes), "image/png")}
+            form = {
+                key: _form_field(value)
+                for key, value in burn_request.items()
+                if value is not None and value != ""
+            }
+            result = await _api_json(
                 "POST",
-                "/api/engrave/prepare",
+                "/api/engrave",
                 files=files,
-                timeout=30.0,
+                form_data=form,
+                timeout=300.0,
             )
-            burn_request["temp_path"] = prepare_data.get("temp_path")
-        
-        if not burn_request["temp_path"]:
+        elif not burn_request["temp_path"]:
             return _tool_error("No image provided (need temp_path or image_base64)")
-        
-        # Execute burn via Flask API
-        result = await _api_json(
-            "POST",
-            "/api/engrave",
-            json_body=burn_request,
-            timeout=300.0,
-        )
+        else:
+            # Execute burn via Flask API
+            result = await _api_json(
+                "POST",
+                "/api/engrave",
+                json_body=burn_request,
+                timeout=300.0,
+            )
+        if result.get("dry_run", burn_request["dry_run"]) != burn_request["dry_run"]:
+            # Flask echoes the dry_run it applied; a mismatch means the
+            # request-level override was lost on the way
+            return _tool_error(
+                f"Requested dry_run={burn_request['dry_run']} but Flask ran with "
+                f"dry_run={result['dry_run']}",
+                details=result,
+            )
         result["api_endpoint"] = "/api/engrave"
         result["via_mcp"] = True
         return _tool_text(result)
@@ -564,12 +684,34 @@ async def tool_set_dry_run(arguments: dict) -> list[TextContent]:
         return _tool_error(str(e))
 
 
+def _normalize_packet_hex(packet_hex: str) -> str:
+    """Validate hex text locally (same formats as Flask) and return compact hex.
+
+    Malformed input fails here instead of costing a Flask round-trip.
+    """
+    hex_text = "".join(
+        packet_hex.replace("0x", "").replace("0X", "").replace(",", " ").split()
+    )
+    if len(hex_text) % 2 != 0:
+        raise ValueError("Hex payload must contain an even number of characters")
+    try:
+        return bytes.fromhex(hex_text).hex()
+    except ValueError as exc:
+        raise ValueError(f"Invalid hex payload: {exc}") from exc
+
+
 async def tool_raw_send(arguments: dict) -> list[TextContent]:
     """Send raw protocol bytes via Flask lab endpoint."""
     try:
         packet_hex = str(arguments.get("packet_hex", "")).strip()
         if not packet_hex:
             return _tool_error("packet_hex required")
+        try:
+            packet_hex = _normalize_packet_hex(packet_hex)
+        except ValueError as e:
+            return _tool_error(
+                str(e), hint='Use hex bytes like "ff000400", "ff 00 04 00" or "0xFF,0x00"'
+            )
 
         payload = {
             "packet_hex": packet_hex,
@@ -605,11 +747,13 @@ def _legacy_tool_result_to_payload(result: list[TextContent | ImageContent | Emb
     if not result:
         return {"success": False, "error": "Empty MCP tool response"}
     first = result[0]
+    if isinstance(first, _PayloadText) and first._payload is not None:
+        return first._payload  # built by _tool_text: no parse needed
     text = getattr(first, "text", None)
     if text is None:
         return {"success": True, "result": str(first)}
     try:
-        parsed = json.loads(text)
+        parsed = _json_loads(text)
         if isinstance(parsed, dict):
             return parsed
         return {"success": True, "result": parsed}
@@ -617,28 +761,45 @@ def _legacy_tool_result_to_payload(result: list[TextContent | ImageContent | Emb
         return {"success": True, "result": text}
 
 
+def _legacy_tool(handler):
+    """Register a FastMCP tool whose body is `handler`, a legacy tool_* coroutine.
+
+    The decorated function only supplies the name, docstring and signature
+    (FastMCP builds the argument schema from it via __wrapped__); calls pass
+    the validated arguments straight through as the legacy arguments dict.
+    """
+    def decorate(fn):
+        if inspect.signature(fn).parameters:
+            async def wrapper(**arguments) -> Dict[str, Any]:
+                return _legacy_tool_result_to_payload(await handler(arguments))
+        else:
+            async def wrapper() -> Dict[str, Any]:
+                return _legacy_tool_result_to_payload(await handler())
+        return mcp_http.tool()(functools.wraps(fn)(wrapper))
+    return decorate
+
+
 if mcp_http is not None:
-    @mcp_http.tool()
+    @_legacy_tool(tool_verify_connection)
     async def k6_verify_connection() -> Dict[str, Any]:
         """Connect to the K6 device through Flask and return firmware/version status."""
-        return _legacy_tool_result_to_payload(await tool_verify_connection())
 
 
-    @mcp_http.tool()
+    @_legacy_tool(tool_get_status)
     async def k6_get_status() -> Dict[str, Any]:
         """Return current K6 status including connection, mode flags, and firmware version."""
-        return _legacy_tool_result_to_payload(await tool_get_status())
 
 
-    @mcp_http.tool()
-    async def k6_load_image(image_name: str = "default-image.png", image_base64: str = "") -> Dict[str, Any]:
+    @_legacy_tool(tool_load_image)
+    async def k6_load_image(
+        image_name: str = "default-image.png",
+        image_base64: str = "",
+        embed: bool = True,
+    ) -> Dict[str, Any]:
         """Load a burn image from samples or provided base64 data and return normalized payload."""
-        return _legacy_tool_result_to_payload(
-            await tool_load_image({"image_name": image_name, "image_base64": image_base64})
-        )
 
 
-    @mcp_http.tool()
+    @_legacy_tool(tool_generate_qr)
     async def k6_generate_qr(
         ssid: str,
         password: str = "",
@@ -647,20 +808,9 @@ if mcp_http is not None:
         show_password: bool = False,
     ) -> Dict[str, Any]:
         """Generate a WiFi QR image (base64 + metadata) for preview or burn workflows."""
-        return _legacy_tool_result_to_payload(
-            await tool_generate_qr(
-                {
-                    "ssid": ssid,
-                    "password": password,
-                    "security": security,
-                    "description": description,
-                    "show_password": show_password,
-                }
-            )
-        )
 
 
-    @mcp_http.tool()
+    @_legacy_tool(tool_burn_job)
     async def k6_burn_job(
         image_base64: str = "",
         temp_path: str = "",
@@ -671,34 +821,19 @@ if mcp_http is not None:
         dry_run: bool = True,
     ) -> Dict[str, Any]:
         """Execute a burn job through Flask with optional dry-run and center overrides."""
-        return _legacy_tool_result_to_payload(
-            await tool_burn_job(
-                {
-                    "image_base64": image_base64,
-                    "temp_path": temp_path,
-                    "power": power,
-                    "depth": depth,
-                    "center_x": center_x,
-                    "center_y": center_y,
-                    "dry_run": dry_run,
-                }
-            )
-        )
 
 
-    @mcp_http.tool()
+    @_legacy_tool(tool_list_samples)
     async def k6_list_samples() -> Dict[str, Any]:
         """List sample images available in the Flask image library."""
-        return _legacy_tool_result_to_payload(await tool_list_samples())
 
 
-    @mcp_http.tool()
+    @_legacy_tool(tool_set_dry_run)
     async def k6_set_dry_run(enabled: bool = True) -> Dict[str, Any]:
         """Enable or disable dry-run mode in Flask settings."""
-        return _legacy_tool_result_to_payload(await tool_set_dry_run({"enabled": enabled}))
 
 
-    @mcp_http.tool()
+    @_legacy_tool(tool_raw_send)
     async def k6_raw_send(
         packet_hex: str,
         timeout: float = 2.0,
@@ -708,18 +843,6 @@ if mcp_http is not None:
         save_logs: bool = True,
     ) -> Dict[str, Any]:
         """Send raw hex protocol bytes to K6 and return raw response diagnostics."""
-        return _legacy_tool_result_to_payload(
-            await tool_raw_send(
-                {
-                    "packet_hex": packet_hex,
-                    "timeout": timeout,
-                    "read_size": read_size,
-                    "flush_input": flush_input,
-                    "settle_ms": settle_ms,
-                    "save_logs": save_logs,
-                }
-            )
-        )
 
 
 # ==============================================================================
@@ -732,6 +855,11 @@ def main():
     port = int(os.getenv("MCP_PORT", "8081"))
     requested_transport = os.getenv("MCP_TRANSPORT", "streamable-http").lower()
 
+    # Both transports create their loop via the asyncio policy (anyio / uvicorn)
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+
     if mcp_http is not None:
         logger.info("Starting FastMCP network transport")
         logger.info(f"Transport request: {requested_transport}")
@@ -834,11 +962,16 @@ def main():
 
     starlette_app = Starlette(debug=False, routes=routes, lifespan=lifespan)
     
-    # Run with uvicorn
+    # Run with uvicorn: uvloop when present (matches the policy set above);
+    # SSE is plain HTTP, so skip loading a websocket protocol implementation.
+    # HTTP/1.1 only: MCP clients reach us over plain-text loopback/LAN, where
+    # HTTP/2 (h2c) is not negotiated, and each SSE session is a single stream.
     uvicorn.run(
         starlette_app,
         host=host,
         port=port,
+        loop="uvloop" if uvloop is not None else "asyncio",
+        ws="none",
         log_level="info"
     )
 
@@ -5,19 +5,38 @@ Web interface for Wainlux K6 laser engraver.
 Access at http://<pi-ip>:8080
 """
 
-from flask import Flask, render_template, request, jsonify, Response
+from flask import (
+    Flask,
+    render_template,
+    request,
+    jsonify,
+    Response,
+    g,
+    has_request_context,
+    send_file,
+)
 from werkzeug.exceptions import HTTPException
 from pathlib import Path
+import base64
+import binascii
+import csv
+import hashlib
+import io
 import logging
-import tempfile
 import sys
 import os
 import json
 import time
 import queue
 import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import zip_longest
 from typing import Optional
 from uuid import uuid4
+import numpy as np
+import PIL
 from PIL import Image, ImageDraw
 
 # Add k6 library to path (located in /app/k6 in container)
@@ -26,11 +45,21 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 sys.path.insert(0, str(Path(__file__).parent))  # Add /app/app for services module
 
 from k6.csv_logger import CSVLogger
+from k6.byte_logger import ByteDumpLogger
 from k6.commands import K6CommandBuilder, CommandSequence
 from services import ImageService, K6Service, QRService, PatternService, PipelineService, PreviewService
 from services.k6_service import K6DeviceManager
 from constants import K6Constants
-from utils import safe_int, safe_float, parse_bool, file_timestamp, iso_timestamp
+from utils import (
+    safe_int,
+    safe_float,
+    parse_bool,
+    file_timestamp,
+    iso_timestamp,
+    load_font,
+    text_bbox,
+    DEJAVU_SANS,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -79,6 +108,7 @@ logger.info(f"K6_MOCK_DEVICE env: {os.getenv('K6_MOCK_DEVICE', 'not set')}")
 logger.info(f"Mock mode active: {device_manager.mock_mode}")
 logger.info(f"Dry run default: {DEFAULT_DRY_RUN}")
 logger.info(f"Operation mode default: {DEFAULT_MODE}")
+logger.info(f"Pillow version: {PIL.__version__} (SIMD build: {'.post' in PIL.__version__})")
 logger.info(f"================================")
 
 def get_operation_mode():
@@ -115,29 +145,134 @@ def _json_payload() -> dict:
     return data
 
 
+def _bulk_jsonify(obj, status: int = 200) -> Response:
+    """JSON response for large payloads: compact, unsorted keys.
+
+    jsonify sorts every dict's keys, which dominates serialization for long
+    lists of small dicts (report timelines, preview lists). Key order is not
+    part of any API contract, so skip the sort. orjson has no ARMv6 wheel.
+    """
+    body = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    return Response(body, status=status, mimetype="application/json")
+
+
+# Validated DATA_DIR paths (raw path string -> (resolved path, expiry)).
+# Pipeline steps pass the same temp path through several endpoints; caching
+# the resolve/containment check skips repeat resolve syscalls. Existence is
+# still checked on every call, and failed checks are never cached.
+SAFE_PATH_CACHE_MAX = 128
+SAFE_PATH_CACHE_TTL_S = 5.0
+_safe_path_cache: OrderedDict[str, tuple[Path, float]] = OrderedDict()
+_safe_path_cache_lock = threading.Lock()
+
+
 def _safe_data_path(path_str: str, require_exists: bool = True) -> Path:
     """Resolve and validate a path inside DATA_DIR."""
     if not path_str:
         raise ValueError("Path is required")
-    path = Path(path_str).resolve()
-    data_root = DATA_DIR.resolve()
-    if data_root not in path.parents and path != data_root:
-        raise ValueError("Path must be inside data directory")
+
+    now = time.monotonic()
+    path = None
+    with _safe_path_cache_lock:
+        cached = _safe_path_cache.get(path_str)
+        if cached is not None:
+            if cached[1] > now:
+                _safe_path_cache.move_to_end(path_str)
+                path = cached[0]
+            else:
+                del _safe_path_cache[path_str]
+
+    if path is None:
+        path = Path(path_str).resolve()
+        data_root = DATA_DIR.resolve()
+        if data_root not in path.parents and path != data_root:
+            raise ValueError("Path must be inside data directory")
+        with _safe_path_cache_lock:
+            _safe_path_cache[path_str] = (path, now + SAFE_PATH_CACHE_TTL_S)
+            _safe_path_cache.move_to_end(path_str)
+            while len(_safe_path_cache) > SAFE_PATH_CACHE_MAX:
+                _safe_path_cache.popitem(last=False)
+
     if require_exists and not path.exists():
         raise FileNotFoundError(f"Path not found: {path}")
     return path
 
 
+def _invalidate_data_path(*paths) -> None:
+    """Drop cached _safe_data_path entries for raw or resolved paths."""
+    targets = {str(path) for path in paths}
+    if not targets:
+        return
+    with _safe_path_cache_lock:
+        for key, (resolved, _) in list(_safe_path_cache.items()):
+            if key in targets or str(resolved) in targets:
+                del _safe_path_cache[key]
+
+
+def _unlink_quiet(path) -> None:
+    """os.unlink, ignoring a missing file (no Path object per call)."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _discard_data_file(path) -> None:
+    """Delete a DATA_DIR file and forget its cached validation.
+
+    Inside a _deferred_discards() block the delete is queued instead.
+    """
+    batch = g.get("discard_batch") if has_request_context() else None
+    if batch is not None:
+        batch.append(path)
+        return
+    _invalidate_data_path(path)
+    _unlink_quiet(path)
+
+
+@contextmanager
+def _deferred_discards():
+    """Queue _discard_data_file calls and run them in one pass on exit.
+
+    Multi-band/multi-job burns discard four pipeline artifacts per band; batching
+    does one cache sweep for all of them instead of one per file.
+    """
+    if g.get("discard_batch") is not None:
+        yield  # Nested: outermost block owns the batch
+        return
+    g.discard_batch = []
+    try:
+        yield
+    finally:
+        batch = g.pop("discard_batch", [])
+        _invalidate_data_path(*batch)
+        for path in batch:
+            _unlink_quiet(path)
+
+
+def _save_preview_png(img: Image.Image, path: Path) -> None:
+    """Write a preview PNG with one write + atomic rename (fast compression)."""
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG", compress_level=1)
+    tmp_path = path.with_suffix(".png.tmp")
+    tmp_path.write_bytes(buffer.getbuffer())
+    os.replace(tmp_path, path)
+
+
 def _safe_log_path(path_str: str) -> Path:
     """Resolve and validate a CSV/log path inside DATA_DIR."""
     return _safe_data_path(path_str, require_exists=True)
 
 # Progress tracking for SSE (pub/sub broadcast model)
+# Copy-on-write: writers swap in a new tuple under the lock; emit_progress
+# reads one reference without locking (safe with or without the GIL).
 PROGRESS_SUBSCRIBER_MAX = 200
-progress_subscribers: set[queue.Queue] = set()
+progress_subscribers: tuple[queue.Queue, ...] = ()
 progress_subscribers_lock = threading.Lock()
 burn_in_progress = False
-burn_cancel_event = threading.Event()  # Signal to cancel active burn
+# Cancel signal for the active burn. A one-slot list is read lock-free in the
+# per-chunk hot loop (Event.is_set takes the condition lock); nothing waits on it.
+burn_cancel_flag = [False]
 
 # Data directory for logs
 DATA_DIR = Path(__file__).parents[1] / "data"
@@ -203,22 +338,64 @@ def _normalize_embed_image(
     }
 
 
+def _open_upload_image(file, timestamp: str) -> tuple[Image.Image, int]:
+    """Open an uploaded image (raster or SVG) for _normalize_embed_image.
+
+    SVG is detected by content (XML declaration or <svg tag) and rasterized
+    at 800px width; anything else must be a format PIL can decode.
+
+    Returns:
+        Tuple of (PIL Image, upload size in bytes)
+
+    Raises:
+        ValueError: If the upload is not a decodable image
+        RuntimeError: If SVG conversion is unavailable or fails
+    """
+    file_content = file.read()
+    head = file_content[:100].lower()
+
+    if b"<svg" in head or b"<?xml" in head:
+        logger.info(f"Detected SVG: {file.filename}")
+        svg_temp = DATA_DIR / f"upload_{timestamp}.svg"
+        with open(svg_temp, "wb") as f:
+            f.write(file_content)
+        try:
+            # Convert SVG → PNG (800px width, auto height); stays in memory
+            return image_service.svg_to_png(str(svg_temp), width=800), len(file_content)
+        finally:
+            _unlink_quiet(svg_temp)
+
+    # PIL validates the image data; the upload is in memory, so OSError
+    # here means undecodable or truncated content, not an I/O failure
+    try:
+        img = Image.open(io.BytesIO(file_content))
+        img.load()
+    except OSError as e:
+        raise ValueError(f"Invalid image upload: {file.filename} is not a decodable image") from e
+    return img, len(file_content)
+
+
 def emit_progress(phase: str, progress: int, message: str):
-    """Emit a progress event to all SSE listeners."""
-    event = {
+    """Emit a progress event to all SSE listeners.
+
+    Nothing is built when no stream is open; otherwise the event is JSON-encoded
+    once and the same string is queued for every listener.
+    """
+    logger.info(f"EMIT_PROGRESS: phase={phase}, progress={progress}, message={message}")
+    subscribers = progress_subscribers
+    if not subscribers:
+        return
+    payload = json.dumps({
         "phase": phase,
         "progress": progress,
         "message": message,
         "timestamp": iso_timestamp(),
-    }
-    logger.info(f"EMIT_PROGRESS: phase={phase}, progress={progress}, message={message}")
+    })
     dropped = 0
     delivered = 0
-    with progress_subscribers_lock:
-        subscribers = list(progress_subscribers)
     for subscriber in subscribers:
         try:
-            subscriber.put_nowait(event)
+            subscriber.put_nowait(payload)
             delivered += 1
         except queue.Full:
             dropped += 1
@@ -227,7 +404,8 @@ def emit_progress(phase: str, progress: int, message: str):
 
 def _run_burn_with_csv(
     *,
-    image_path: str,
+    image_path: Optional[str] = None,
+    image: Optional[Image.Image] = None,
     power: int,
     depth: int,
     center_x: Optional[int],
@@ -246,13 +424,19 @@ def _run_burn_with_csv(
     vector_depth: int = 0,
     vector_point_count: int = 0,
 ) -> tuple[dict, int]:
-    """Execute one burn via pipeline stages (process/build/execute) with CSV logging."""
+    """Execute one burn via pipeline stages (process/build/execute) with CSV logging.
+
+    Pass either image_path or an in-memory image (skips the PNG write/read).
+    """
+    if image is None and not image_path:
+        raise ValueError("image_path or image is required")
     timestamp = file_timestamp()
     run_id = str(uuid4())
     csv_path = DATA_DIR / f"{csv_prefix}-{timestamp}.csv"
     process_result = None
     build_result = None
-    keep_pipeline_artifacts = False
+    # Artifacts (incl. the preview PNG) are only kept for inspection modes
+    keep_pipeline_artifacts = get_operation_mode() in {"verbose", "single-step"}
 
     _ensure_device_connected(auto_connect=True)
 
@@ -269,6 +453,8 @@ def _run_burn_with_csv(
             DATA_DIR,
             threshold=128,
             invert=False,
+            image=image,
+            write_preview=keep_pipeline_artifacts,
         )
 
         resolved_center_x = center_x
@@ -316,19 +502,17 @@ def _run_burn_with_csv(
             emit_progress("error", 0, str(exc))
         return {"success": False, "error": str(exc)}, 500
     finally:
-        mode = get_operation_mode()
-        keep_pipeline_artifacts = mode in {"verbose", "single-step"}
         if not keep_pipeline_artifacts and process_result and build_result:
             for key in ("processed_path", "preview_path"):
                 path = process_result.get(key)
                 if path:
-                    Path(path).unlink(missing_ok=True)
+                    _discard_data_file(path)
             for key in ("command_path", "metadata_path"):
                 path = build_result.get(key)
                 if path:
-                    Path(path).unlink(missing_ok=True)
+                    _discard_data_file(path)
 
-    if burn_cancel_event.is_set():
+    if burn_cancel_flag[0]:
         emit_progress("stopped", 0, "Burn cancelled by user")
         return {"success": False, "error": "Cancelled by user"}, 400
 
@@ -362,7 +546,7 @@ class ProgressCSVLogger(CSVLogger):
     - upload: Data chunk transmission (0-100%)
     - burning: Laser burn progress from device status (0-100%)
     
-    Also checks burn_cancel_event to allow user cancellation.
+    Also checks burn_cancel_flag to allow user cancellation.
     """
     
     def __init__(self, *args, **kwargs):
@@ -384,7 +568,7 @@ class ProgressCSVLogger(CSVLogger):
         device_state="IDLE",
     ):
         # Check for user cancellation
-        if burn_cancel_event.is_set():
+        if burn_cancel_flag[0]:
             logger.info("Burn cancelled by user")
             emit_progress("stopped", 0, "Burn cancelled by user")
             raise KeyboardInterrupt("Burn cancelled by user")
@@ -463,8 +647,7 @@ def list_materials():
         if materials_dir.exists():
             for json_file in materials_dir.glob("*.json"):
                 with open(json_file, 'r') as f:
-                    import json as json_module
-                    material_data = json_module.load(f)
+                    material_data = json.load(f)
                     material_data['id'] = json_file.stem  # filename without .json
                     materials.append(material_data)
         materials.sort(key=lambda x: x.get('name', ''))
@@ -483,8 +666,7 @@ def list_shapes():
         if shapes_dir.exists():
             for json_file in shapes_dir.glob("*.json"):
                 with open(json_file, 'r') as f:
-                    import json as json_module
-                    shape_data = json_module.load(f)
+                    shape_data = json.load(f)
                     shape_data['id'] = json_file.stem
                     shapes.append(shape_data)
         shapes.sort(key=lambda x: x.get('name', ''))
@@ -537,6 +719,13 @@ def list_images():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@lru_cache(maxsize=32)
+def _image_header_info(path: str, mtime_ns: int) -> tuple[int, int, str]:
+    """Return (width, height, mode) from the file header; keyed by mtime."""
+    with Image.open(path) as img:
+        return img.width, img.height, img.mode
+
+
 @app.route("/api/images/serve/<filename>", methods=["GET"])
 def serve_image(filename):
     """Serve sample image file"""
@@ -549,9 +738,18 @@ def serve_image(filename):
     
     if not file_path.exists():
         return jsonify({"success": False, "error": "Image not found"}), 404
-    
-    from flask import send_file
-    return send_file(str(file_path), mimetype='image/png')
+
+    response = send_file(str(file_path), mimetype='image/png')
+    # Dimensions as headers so clients (MCP) need not decode the image
+    try:
+        width, height, mode = _image_header_info(str(file_path), file_path.stat().st_mtime_ns)
+    except OSError as e:
+        logger.warning(f"Image header read failed for {filename}: {e}")
+    else:
+        response.headers["X-Image-Width"] = str(width)
+        response.headers["X-Image-Height"] = str(height)
+        response.headers["X-Image-Mode"] = mode
+    return response
 
 
 @app.route("/api/connect", methods=["POST"])
@@ -661,10 +859,8 @@ def crosshair():
 @app.route("/api/test/stop", methods=["POST"])
 def test_stop():
     """Cancel burn and reset device - interrupts Python script and sends CONNECT to reset device"""
-    global burn_cancel_event
-
     # Set cancel flag to interrupt any active burn loop
-    burn_cancel_event.set()
+    burn_cancel_flag[0] = True
     logger.info("Burn cancellation requested")
 
     success, message = k6_service.stop()
@@ -702,38 +898,13 @@ def engrave_prepare():
         source = str(request.form.get("source", "upload") or "upload")
         source_reference = str(request.form.get("source_reference", original_filename) or original_filename)
         
-        # Detect SVG by content (XML declaration or <svg tag)
-        file_content = file.read()
-        file.seek(0)  # Reset for save
-        
-        file_size_bytes = len(file_content)
-        is_svg = False
-        if file_content[:100].lower().find(b'<svg') != -1 or file_content[:100].lower().find(b'<?xml') != -1:
-            is_svg = True
-            logger.info(f"Detected SVG: {original_filename}")
-        
-        if is_svg:
-            # Save SVG to temp file
-            svg_temp = DATA_DIR / f"upload_{timestamp}.svg"
-            with open(svg_temp, 'wb') as f:
-                f.write(file_content)
-            
-            try:
-                # Convert SVG → PNG (800px width, auto height)
-                img = image_service.svg_to_png(str(svg_temp), width=800)
-                # Save rasterized PNG
-                img.save(str(temp_path))
-            finally:
-                svg_temp.unlink(missing_ok=True)
-        else:
-            # Standard raster image upload
-            file.save(str(temp_path))
+        source_img, file_size_bytes = _open_upload_image(file, timestamp)
 
-        # PIL validates image format - will fail here if invalid
-        with Image.open(temp_path) as img:
+        with source_img as img:
             normalized_img, image_meta = _normalize_embed_image(img, max_dimension=MAX_EMBED_IMAGE_DIM)
             # Save normalized image to temp file for downstream burn path
-            normalized_img.save(str(temp_path))
+            # (read back once by the burn; fast compression, atomic replace)
+            _save_preview_png(normalized_img, temp_path)
             # Generate base64 (embedded source of truth for job structure)
             data_url = image_service.image_to_base64(normalized_img)
 
@@ -755,10 +926,15 @@ def engrave_prepare():
             "max_dimension": image_meta["max_dimension"],
         })
 
-    except (ValueError, OSError) as e:
+    except ValueError as e:
+        logger.error(f"Engrave prepare failed: {e}")
+        if "temp_path" in locals():
+            _discard_data_file(temp_path)
+        return jsonify({"success": False, "error": str(e)}), 400
+    except (RuntimeError, OSError) as e:
         logger.error(f"Engrave prepare failed: {e}")
         if "temp_path" in locals():
-            Path(temp_path).unlink(missing_ok=True)
+            _discard_data_file(temp_path)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -777,29 +953,29 @@ def engrave():
         if not k6_service.home():
             logger.warning("Pre-burn HOME failed; continuing with burn attempt")
 
-        # Accept both JSON (with temp_path) and FormData (direct upload)
-        data = _json_payload()
+        # Accept both JSON (with temp_path) and FormData (direct upload +
+        # burn params in one request, e.g. MCP k6_burn_job)
+        data = request.form.to_dict() if request.files else _json_payload()
         temp_path = data.get("temp_path", "")
+        image = None
 
         # SAFETY: request-level dry_run must override session defaults.
         dry_run_input = data.get("dry_run", None)
-        if dry_run_input is None and "dry_run" in request.form:
-            dry_run_input = request.form.get("dry_run")
         effective_dry_run = get_dry_run() if dry_run_input is None else parse_bool(dry_run_input)
         
-        # Fallback: if no temp_path, accept direct file upload (backward compat)
+        # Fallback: if no temp_path, accept direct file upload; normalized in
+        # memory exactly like /api/engrave/prepare, no temp file
         if temp_path:
             try:
                 temp_path = str(_safe_data_path(temp_path, require_exists=True))
             except (ValueError, FileNotFoundError) as e:
                 return jsonify({"success": False, "error": str(e)}), 400
         elif "image" in request.files:
-            file = request.files["image"]
-            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-                file.save(tmp.name)
-                temp_path = tmp.name
-        
-        if not temp_path or not Path(temp_path).exists():
+            upload, _ = _open_upload_image(request.files["image"], file_timestamp())
+            with upload:
+                image, _ = _normalize_embed_image(upload, max_dimension=MAX_EMBED_IMAGE_DIM)
+
+        if image is None and (not temp_path or not Path(temp_path).exists()):
             return jsonify({"success": False, "error": "No image file"}), 400
 
         # Get parameters
@@ -817,14 +993,17 @@ def engrave():
             center_y = safe_int(center_y, "center_y")
 
         # Clear cancel flag
-        global burn_cancel_event
-        burn_cancel_event.clear()
+        burn_cancel_flag[0] = False
         
-        logger.info(f"=== ENGRAVE START === temp_path={temp_path}, power={power}, depth={depth}")
+        logger.info(
+            f"=== ENGRAVE START === temp_path={temp_path or '<upload>'}, "
+            f"power={power}, depth={depth}"
+        )
         logger.info(f"Device connected: {device_manager.is_connected()}")
         
         response, status_code = _run_burn_with_csv(
-            image_path=temp_path,
+            image_path=temp_path or None,
+            image=image,
             power=power,
             depth=depth,
             center_x=center_x,
@@ -839,7 +1018,8 @@ def engrave():
         )
         
         # Clean up temp file
-        Path(temp_path).unlink(missing_ok=True)
+        if temp_path:
+            _discard_data_file(temp_path)
         
         if status_code == 200:
             response["dry_run"] = effective_dry_run
@@ -848,16 +1028,16 @@ def engrave():
     except KeyboardInterrupt:
         logger.info("Burn cancelled by user")
         emit_progress("stopped", 0, "Burn cancelled")
-        if "temp_path" in locals():
-            Path(temp_path).unlink(missing_ok=True)
+        if "temp_path" in locals() and temp_path:
+            _discard_data_file(temp_path)
         return jsonify({"success": False, "error": "Cancelled by user"}), 400
     except ValueError as e:
         return jsonify({"success": False, "error": str(e)}), 400
     except (RuntimeError, OSError) as e:
         logger.error(f"Engrave failed: {e}")
         emit_progress("error", 0, str(e))
-        if "temp_path" in locals():
-            Path(temp_path).unlink(missing_ok=True)
+        if "temp_path" in locals() and temp_path:
+            _discard_data_file(temp_path)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -974,12 +1154,10 @@ def pipeline_execute():
         byte_logger = None
         
         if log_mode in ("csv", "both"):
-            from k6.csv_logger import CSVLogger
             csv_path = DATA_DIR / f"execute_{timestamp}.csv"
             csv_logger = CSVLogger(str(csv_path), run_id=run_id, job_id="pipeline_execute")
         
         if log_mode in ("bytes", "both"):
-            from k6.byte_logger import ByteDumpLogger
             byte_path = DATA_DIR / f"execute_{timestamp}"
             byte_logger = ByteDumpLogger(str(byte_path))
 
@@ -1019,25 +1197,39 @@ def pipeline_execute():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+# Constant parts of hot GET payloads, built once at import.
+_STATUS_TEMPLATE = {
+    "progress": 0,
+    "max_width": K6_MAX_WIDTH,
+    "max_height": K6_MAX_HEIGHT,
+    "resolution_mm_per_px": K6Constants.RESOLUTION_MM_PER_PX,
+    "center_x_offset_px": K6Constants.CENTER_X_OFFSET_PX,
+    "center_y_px": K6Constants.CENTER_Y_PX,
+    "default_center_x_px": K6Constants.DEFAULT_CENTER_X_PX,
+    "default_center_y_px": K6Constants.DEFAULT_CENTER_Y_PX,
+    "work_width_mm": K6Constants.WORK_WIDTH_MM,
+    "work_height_mm": K6Constants.WORK_HEIGHT_MM,
+}
+_DEBUG_ENV = {
+    "K6_MOCK_DEVICE": os.getenv("K6_MOCK_DEVICE", "not set"),
+    "FLASK_ENV": os.getenv("FLASK_ENV", "not set"),
+    "PYTHONUNBUFFERED": os.getenv("PYTHONUNBUFFERED", "not set"),
+}
+_DEBUG_DEFAULTS = {
+    "operation_mode": DEFAULT_MODE,
+    "dry_run": DEFAULT_DRY_RUN,
+}
+_VALID_MODES_LIST = tuple(VALID_MODES)
+
+
 @app.route("/api/status", methods=["GET"])
 def status():
     """Get current K6 status"""
     connected = device_manager.is_connected()
-    response = {
-        "connected": connected,
-        "state": "idle" if connected else "disconnected",
-        "progress": 0,
-        "message": "Ready" if connected else "Not connected",
-        "max_width": K6_MAX_WIDTH,
-        "max_height": K6_MAX_HEIGHT,
-        "resolution_mm_per_px": K6Constants.RESOLUTION_MM_PER_PX,
-        "center_x_offset_px": K6Constants.CENTER_X_OFFSET_PX,
-        "center_y_px": K6Constants.CENTER_Y_PX,
-        "default_center_x_px": K6Constants.DEFAULT_CENTER_X_PX,
-        "default_center_y_px": K6Constants.DEFAULT_CENTER_Y_PX,
-        "work_width_mm": K6Constants.WORK_WIDTH_MM,
-        "work_height_mm": K6Constants.WORK_HEIGHT_MM,
-    }
+    response = _STATUS_TEMPLATE.copy()
+    response["connected"] = connected
+    response["state"] = "idle" if connected else "disconnected"
+    response["message"] = "Ready" if connected else "Not connected"
     version = device_manager.version
     if version:
         # device_manager.version may already be a string (mock) or a tuple
@@ -1057,13 +1249,8 @@ def status():
 @app.route("/api/debug/env", methods=["GET"])
 def debug_env():
     """Debug endpoint to check environment variables and configuration"""
-    import os
     return jsonify({
-        "env": {
-            "K6_MOCK_DEVICE": os.getenv("K6_MOCK_DEVICE", "not set"),
-            "FLASK_ENV": os.getenv("FLASK_ENV", "not set"),
-            "PYTHONUNBUFFERED": os.getenv("PYTHONUNBUFFERED", "not set"),
-        },
+        "env": _DEBUG_ENV,
         "device_manager": {
             "mock_mode": device_manager.mock_mode,
             "dry_run": device_manager.dry_run,
@@ -1071,10 +1258,7 @@ def debug_env():
             "version": str(device_manager.version) if device_manager.version else None,
             "transport_type": type(device_manager.transport).__name__ if device_manager.transport else "None",
         },
-        "defaults": {
-            "operation_mode": DEFAULT_MODE,
-            "dry_run": DEFAULT_DRY_RUN,
-        }
+        "defaults": _DEBUG_DEFAULTS,
     })
 
 
@@ -1085,7 +1269,7 @@ def get_settings():
         "success": True,
         "operation_mode": get_operation_mode(),
         "dry_run": get_dry_run(),
-        "valid_modes": list(VALID_MODES),
+        "valid_modes": _VALID_MODES_LIST,
         "persisted": False,
     })
 
@@ -1130,9 +1314,10 @@ def progress_stream():
     """SSE endpoint for real-time progress updates."""
 
     def generate():
-        client_queue = queue.Queue(maxsize=PROGRESS_SUBSCRIBER_MAX)
+        global progress_subscribers
+        client_queue: queue.Queue[str] = queue.Queue(maxsize=PROGRESS_SUBSCRIBER_MAX)
         with progress_subscribers_lock:
-            progress_subscribers.add(client_queue)
+            progress_subscribers = progress_subscribers + (client_queue,)
 
         # Send initial connection event
         initial_event = {
@@ -1145,15 +1330,17 @@ def progress_stream():
         try:
             while True:
                 try:
-                    # Wait for events with timeout
-                    event = client_queue.get(timeout=30)
-                    yield f"data: {json.dumps(event)}\n\n"
+                    # Wait for events with timeout (already JSON-encoded)
+                    payload = client_queue.get(timeout=30)
+                    yield f"data: {payload}\n\n"
                 except queue.Empty:
                     # Send keepalive
                     yield ": keepalive\n\n"
         finally:
             with progress_subscribers_lock:
-                progress_subscribers.discard(client_queue)
+                progress_subscribers = tuple(
+                    q for q in progress_subscribers if q is not client_queue
+                )
 
     return Response(generate(), mimetype="text/event-stream")
 
@@ -1173,10 +1360,12 @@ def calibration_generate():
         # Save to temp file
         timestamp = file_timestamp()
         temp_path = DATA_DIR / f"calibration_preview_{timestamp}.png"
-        img.save(str(temp_path))
+        _save_preview_png(img, temp_path)
 
         # Generate preview (unified preview path)
-        data_url = image_service.image_to_base64(img)
+        data_url = image_service.image_to_base64(
+            img, cache_key=("calibration", pattern, resolution, size_mm)
+        )
 
         return jsonify(
             {
@@ -1197,7 +1386,7 @@ def calibration_generate():
     except (RuntimeError, OSError) as e:
         logger.error(f"Calibration generate failed: {e}")
         if "temp_path" in locals():
-            Path(temp_path).unlink(missing_ok=True)
+            _discard_data_file(temp_path)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -1243,56 +1432,48 @@ def calibration_burn_bounds():
         power = safe_int(data.get("power", 500), "power", 0, 1000)
         depth = safe_int(data.get("depth", 10), "depth", 1, 255)
 
-        # Create rectangle frame image (white background, black outline)
-        img = Image.new("1", (width, height), 1)  # 1=white
-        draw = ImageDraw.Draw(img)
+        # Create rectangle frame image (bool canvas: True=white, False=black)
+        canvas = np.ones((height, width), dtype=bool)
 
         # Draw thick border (2-3 pixel width for visibility)
         margin = 2
-        draw.rectangle(
+        PatternService.outline(
+            canvas,
             (margin, margin, width - 1 - margin, height - 1 - margin),
-            outline=0,  # 0=black
             width=3,
         )
+        img = Image.fromarray(canvas)
 
-        # Save to temp file
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            img.save(tmp.name)
-            tmp_path = tmp.name
+        response, status_code = _run_burn_with_csv(
+            image=img,
+            power=power,
+            depth=depth,
+            center_x=(width // 2) + K6_CENTER_X_OFFSET,
+            center_y=height // 2,
+            csv_prefix="calibration-bounds",
+            job_id="calibration_bounds",
+            setup_message="Preparing bounds frame burn",
+            complete_message_template=None,
+            emit_error=True,
+        )
 
-        try:
-            response, status_code = _run_burn_with_csv(
-                image_path=tmp_path,
-                power=power,
-                depth=depth,
-                center_x=(width // 2) + K6_CENTER_X_OFFSET,
-                center_y=height // 2,
-                csv_prefix="calibration-bounds",
-                job_id="calibration_bounds",
-                setup_message="Preparing bounds frame burn",
-                complete_message_template=None,
-                emit_error=True,
+        if status_code == 200:
+            return jsonify(
+                {
+                    "success": True,
+                    "message": "Bounds frame burned",
+                    "width": width,
+                    "height": height,
+                    "power": power,
+                    "depth": depth,
+                    "total_time": response.get("total_time", 0),
+                    "chunks": response.get("chunks", 0),
+                    "csv_log": response.get("csv_log"),
+                    "run_id": response.get("run_id"),
+                }
             )
-
-            if status_code == 200:
-                return jsonify(
-                    {
-                        "success": True,
-                        "message": "Bounds frame burned",
-                        "width": width,
-                        "height": height,
-                        "power": power,
-                        "depth": depth,
-                        "total_time": response.get("total_time", 0),
-                        "chunks": response.get("chunks", 0),
-                        "csv_log": response.get("csv_log"),
-                        "run_id": response.get("run_id"),
-                    }
-                )
-            else:
-                return jsonify({"success": False, "error": response.get("error", "Bounds burn failed")}), status_code
-        finally:
-            Path(tmp_path).unlink(missing_ok=True)
+        else:
+            return jsonify({"success": False, "error": response.get("error", "Bounds burn failed")}), status_code
 
     except ValueError as e:
         return jsonify({"success": False, "error": str(e)}), 400
@@ -1429,7 +1610,7 @@ def qr_generate():
         # Save to temp file (will be used by burn endpoint)
         timestamp = file_timestamp()
         temp_path = DATA_DIR / f"qr_preview_{timestamp}.png"
-        canvas.save(str(temp_path))
+        _save_preview_png(canvas, temp_path)
         
         # Convert to base64 for preview display (generic image preview)
         data_url = image_service.image_to_base64(canvas)
@@ -1461,8 +1642,6 @@ def qr_preview():
     Returns command sequence with stats, bounds, and estimated time.
     """
     try:
-        import numpy as np
-
         data = _json_payload()
         ssid = data.get("ssid", "")
         password = data.get("password", "")
@@ -1474,31 +1653,15 @@ def qr_preview():
         if not ssid:
             return jsonify({"success": False, "error": "SSID required"}), 400
 
-        # Validate
-        power = _clamp_int(power, 0, 1000)
-        depth = _clamp_int(depth, 1, 255)
-
         # Use QRService to generate QR image (DRY - single source of truth)
         canvas, metadata = qr_service.generate_wifi_qr(ssid, password, security, description)
         burn_width = metadata["width"]
         burn_height = metadata["height"]
 
-        # Convert to grayscale and threshold to 1-bit
-        gray = canvas.convert("L")
-        threshold = 128
-        binary = gray.point(lambda x: 0 if x < threshold else 255, mode="1")
-        img_array = np.array(binary, dtype=np.uint8)
-
-        # Pad to 8-pixel boundary
-        height, width = img_array.shape
-        padded_width = ((width + 7) // 8) * 8
-        if padded_width > width:
-            padding = np.ones((height, padded_width - width), dtype=np.uint8) * 255
-            img_array = np.hstack([img_array, padding])
-
-        # Bit-pack: 8 pixels per byte (MSB first)
-        img_array = img_array.reshape(height, -1, 8)
-        img_array = np.packbits(img_array, axis=2, bitorder="big").squeeze(axis=2)
+        # Threshold + bit-pack in one pass (same polarity as the burn pipeline)
+        gray = np.asarray(canvas.convert("L"), dtype=np.uint8)
+        img_array = PipelineService.pack_threshold(gray, threshold=128)
+        height = img_array.shape[0]
 
         # === Generate Command Sequence (NO EXECUTION) ===
         seq = CommandSequence(description=f"WiFi QR: {ssid}")
@@ -1521,10 +1684,12 @@ def qr_preview():
         seq.add(K6CommandBuilder.build_connect(1))
         seq.add(K6CommandBuilder.build_connect(2))
 
-        # Data chunks
+        # Data chunks (zero-copy row views; packet builder copies once)
+        flat = memoryview(np.ascontiguousarray(img_array)).cast("B")
+        row_bytes = img_array.shape[1]
         for line_num in range(height):
-            line_data = img_array[line_num].tobytes()
-            seq.add(K6CommandBuilder.build_data_packet(line_data, line_num))
+            start = line_num * row_bytes
+            seq.add(K6CommandBuilder.build_data_packet(flat[start:start + row_bytes], line_num))
 
         # Finalization
         seq.add(K6CommandBuilder.build_init(1))
@@ -1587,8 +1752,7 @@ def qr_burn():
             logger.warning("Pre-QR HOME failed; continuing with burn attempt")
 
         # Clear cancel flag
-        global burn_cancel_event
-        burn_cancel_event.clear()
+        burn_cancel_flag[0] = False
 
         data = _json_payload()
         temp_path = data.get("temp_path", "")
@@ -1612,10 +1776,6 @@ def qr_burn():
             temp_path = str(DATA_DIR / f"qr_ondemand_{timestamp}.png")
             canvas.save(temp_path)
 
-        # Validate
-        power = _clamp_int(power, 0, 1000)
-        depth = _clamp_int(depth, 1, 255)
-
         # Use the temp_path from preview (image already generated)
         logger.info(f"Using pre-generated QR image: {temp_path}")
 
@@ -1648,13 +1808,13 @@ def qr_burn():
         finally:
             # Clean up temp file
             if temp_path:
-                Path(temp_path).unlink(missing_ok=True)
+                _discard_data_file(temp_path)
 
     except KeyboardInterrupt:
         logger.info("QR burn cancelled by user")
         emit_progress("stopped", 0, "Burn cancelled")
         if "temp_path" in locals():
-            Path(temp_path).unlink(missing_ok=True)
+            _discard_data_file(temp_path)
         return jsonify({"success": False, "error": "Cancelled by user"}), 400
     except ValueError as e:
         return jsonify({"success": False, "error": str(e)}), 400
@@ -1662,7 +1822,7 @@ def qr_burn():
         logger.error(f"QR burn failed: {e}")
         emit_progress("error", 0, str(e))
         if "temp_path" in locals():
-            Path(temp_path).unlink(missing_ok=True)
+            _discard_data_file(temp_path)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -1705,15 +1865,10 @@ def qr_alignment():
             draw.line([(x, y - corner_size), (x, y + corner_size)], fill="black", width=2)
 
         # Label
-        try:
-            font = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 24
-            )
-        except (OSError, IOError):
-            font = ImageFont.load_default()
+        font = load_font(DEJAVU_SANS, 24)
 
         label = "K6 Burn Area (75 × 53.98 mm)"
-        bbox = draw.textbbox((0, 0), label, font=font)
+        bbox = text_bbox(DEJAVU_SANS, 24, label)
         text_width = bbox[2] - bbox[0]
         draw.text(
             ((burn_width - text_width) // 2, burn_height // 2 - 12),
@@ -1722,40 +1877,29 @@ def qr_alignment():
             font=font,
         )
 
-        # Save and burn
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            canvas.save(tmp.name)
-            tmp_path = tmp.name
-
-        try:
-            # Position at center
-            center_x = (burn_width // 2) + K6_CENTER_X_OFFSET
-            center_y = K6_DEFAULT_CENTER_Y
-
-            response, status_code = _run_burn_with_csv(
-                image_path=tmp_path,
-                power=power,
-                depth=depth,
-                center_x=center_x,
-                center_y=center_y,
-                csv_prefix="qr-alignment",
-                job_id="qr_alignment",
-                complete_message_template=None,
-                emit_error=False,
-            )
-            if status_code == 200:
-                response["message"] = "Alignment box burned"
-            return jsonify(response), status_code
+        # Burn in-memory canvas, positioned at center
+        center_x = (burn_width // 2) + K6_CENTER_X_OFFSET
+        center_y = K6_DEFAULT_CENTER_Y
 
-        finally:
-            Path(tmp_path).unlink(missing_ok=True)
+        response, status_code = _run_burn_with_csv(
+            image=canvas,
+            power=power,
+            depth=depth,
+            center_x=center_x,
+            center_y=center_y,
+            csv_prefix="qr-alignment",
+            job_id="qr_alignment",
+            complete_message_template=None,
+            emit_error=False,
+        )
+        if status_code == 200:
+            response["message"] = "Alignment box burned"
+        return jsonify(response), status_code
 
     except ValueError as e:
         return jsonify({"success": False, "error": str(e)}), 400
     except (RuntimeError, OSError) as e:
         logger.error(f"Alignment burn failed: {e}")
-        if "tmp_path" in locals():
-            Path(tmp_path).unlink(missing_ok=True)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -1794,6 +1938,7 @@ def alignment_builder_api():
                 card_width_mm=85.6,
                 resolution=resolution
             )
+            preview_key = ("card_alignment", resolution)
             
             # Add alignment info to metadata
             metadata["align_x"] = "left"
@@ -1808,6 +1953,7 @@ def alignment_builder_api():
             img, metadata = PatternService.generate_alignment(
                 width_mm, height_mm, resolution
             )
+            preview_key = ("alignment", width_mm, height_mm, resolution)
             
             # Add alignment info
             metadata["align_x"] = "center"
@@ -1825,12 +1971,12 @@ def alignment_builder_api():
             }), 400
         
         # Convert image to base64 for preview
-        preview_b64 = image_service.image_to_base64(img)
+        preview_b64 = image_service.image_to_base64(img, cache_key=preview_key)
         
         # Save temp file for burning
         timestamp = file_timestamp()
         temp_path = DATA_DIR / f"alignment_builder_{timestamp}.png"
-        img.save(str(temp_path))
+        _save_preview_png(img, temp_path)
         
         return jsonify({
             "success": True,
@@ -1847,18 +1993,76 @@ def alignment_builder_api():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
-def _decode_data_url_image(data_url: str) -> Image.Image:
-    """Decode data URL/base64 image into a PIL image."""
-    import base64
-    import io
+# Base64 decode window (multiple of 4 so unbroken payloads split on quanta).
+B64_DECODE_CHUNK = 64 * 1024
+
+
+# Decoded upload images keyed by (content digest, mode). Preview and burn (and
+# every burn job sharing one upload) carry the same base64 blob; decode it once.
+DECODED_IMAGE_CACHE_MAX = 6
+_decoded_image_cache: OrderedDict[tuple[str, Optional[str]], Image.Image] = OrderedDict()
+_decoded_image_cache_lock = threading.Lock()
+
+
+def _decode_data_url_bytes(data_url: str) -> Image.Image:
+    """Decode data URL/base64 image into a PIL image.
 
-    b64_data = data_url
+    Decodes in fixed windows straight from the data URL so a multi-MB upload
+    never holds a second full-size copy of the base64 text.
+    """
+    start = 0
     if data_url.startswith("data:image"):
-        b64_data = data_url.split(",", 1)[1]
-    raw = base64.b64decode(b64_data)
+        start = data_url.index(",") + 1
+    try:
+        raw = b"".join(
+            binascii.a2b_base64(data_url[offset:offset + B64_DECODE_CHUNK])
+            for offset in range(start, len(data_url), B64_DECODE_CHUNK)
+        )
+    except binascii.Error:
+        # Embedded whitespace can misalign windows; decode in one pass instead
+        raw = base64.b64decode(data_url[start:])
     return Image.open(io.BytesIO(raw))
 
 
+def _decode_data_url_image(data_url: str, mode: Optional[str] = None) -> Image.Image:
+    """Decode data URL image (optionally converted to mode), cached by content.
+
+    Returned images are shared across requests and must be treated as read-only.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for offset in range(0, len(data_url), B64_DECODE_CHUNK):
+        digest.update(data_url[offset:offset + B64_DECODE_CHUNK].encode())
+    key = digest.hexdigest()
+
+    def cached(cache_key):
+        with _decoded_image_cache_lock:
+            img = _decoded_image_cache.get(cache_key)
+            if img is not None:
+                _decoded_image_cache.move_to_end(cache_key)
+            return img
+
+    def store(cache_key, img):
+        with _decoded_image_cache_lock:
+            _decoded_image_cache[cache_key] = img
+            _decoded_image_cache.move_to_end(cache_key)
+            while len(_decoded_image_cache) > DECODED_IMAGE_CACHE_MAX:
+                _decoded_image_cache.popitem(last=False)
+
+    source = cached((key, None))
+    if source is None:
+        source = _decode_data_url_bytes(data_url)
+        source.load()  # decode now so shared instances are never lazily loaded
+        store((key, None), source)
+    if mode is None or source.mode == mode:
+        return source
+
+    converted = cached((key, mode))
+    if converted is None:
+        converted = source.convert(mode)
+        store((key, mode), converted)
+    return converted
+
+
 def _get_layout_pixels(job: dict) -> tuple[float, float, float, float]:
     """Return material center and image offset in pixels from job layout."""
     layout = job.get("layout", {})
@@ -1912,18 +2116,35 @@ def _job_shape_geometry(job: dict, render_spec: dict) -> dict:
 
 def _rasterize_outline_canvas(geometry: dict) -> Image.Image:
     """Rasterize rectangle outline for bounds/combined paths."""
-    canvas = Image.new("1", (geometry["burn_width_px"], geometry["burn_height_px"]), 1)
-    draw = ImageDraw.Draw(canvas)
-    draw.rectangle(
-        geometry["rect"],
-        outline=0,
-        width=geometry["border_width"],
-    )
-    return canvas
+    canvas = np.ones((geometry["burn_height_px"], geometry["burn_width_px"]), dtype=bool)
+    PatternService.outline(canvas, geometry["rect"], width=geometry["border_width"])
+    return Image.fromarray(canvas)
+
+
+def _to_1bit(img: Image.Image, dither: bool = True) -> Image.Image:
+    """Convert to mode "1"; without dither, threshold at 128 and pack bits in NumPy."""
+    if img.mode == "1":
+        return img
+    if dither:
+        return img.convert("1")
+
+    gray = np.asarray(img.convert("L"), dtype=np.uint8)
+    # Mode "1" raw layout is MSB-first rows padded to a byte, bit 1 = white
+    packed = PipelineService.pack_threshold(gray, threshold=128, invert=True)
+    return Image.frombytes("1", img.size, packed.tobytes())
+
+
+# Combined mode crops sources covering more than this multiple of the canvas
+# area before the (dithering) 1-bit conversion.
+COMBINED_CROP_AREA_RATIO = 2
 
 
 def _render_job_image(job: dict, job_config: dict) -> Image.Image:
-    """Render a burn image from job metadata (image/bounds/combined)."""
+    """Render a burn image from job metadata (image/bounds/combined).
+
+    Combined mode honours render_spec["dither"] (default True); False
+    thresholds the source at 128 instead of Floyd-Steinberg dithering.
+    """
     render_spec = job_config.get("render_spec", {})
     mode = render_spec.get("mode", "image")
 
@@ -1933,11 +2154,9 @@ def _render_job_image(job: dict, job_config: dict) -> Image.Image:
     if not image_data:
         raise ValueError("No source image available in job.stages.upload.data")
 
-    source_img = _decode_data_url_image(image_data)
-
     if mode == "image":
         # Keep source untouched; driver pipeline normalizes to burn format.
-        return source_img
+        return _decode_data_url_image(image_data)
 
     geometry = _job_shape_geometry(job, render_spec)
     canvas = _rasterize_outline_canvas(geometry)
@@ -1947,9 +2166,31 @@ def _render_job_image(job: dict, job_config: dict) -> Image.Image:
 
     if mode == "combined":
         _, _, image_offset_x_px, image_offset_y_px = _get_layout_pixels(job)
-        source_bw = source_img.convert("1")
-        img_x = int(round((geometry["burn_width_px"] / 2) + image_offset_x_px - (source_bw.width / 2)))
-        img_y = int(round((geometry["burn_height_px"] / 2) + image_offset_y_px - (source_bw.height / 2)))
+        dither = parse_bool(render_spec.get("dither", True))
+        source_img = _decode_data_url_image(image_data)
+        canvas_width, canvas_height = canvas.size
+        img_x = int(round((canvas_width / 2) + image_offset_x_px - (source_img.width / 2)))
+        img_y = int(round((canvas_height / 2) + image_offset_y_px - (source_img.height / 2)))
+
+        source_area = source_img.width * source_img.height
+        if source_area > COMBINED_CROP_AREA_RATIO * canvas_width * canvas_height:
+            # Oversized source: only convert the window that lands on the canvas
+            window = (
+                max(0, -img_x),
+                max(0, -img_y),
+                min(source_img.width, canvas_width - img_x),
+                min(source_img.height, canvas_height - img_y),
+            )
+            if window[0] >= window[2] or window[1] >= window[3]:
+                return canvas
+            source_bw = _to_1bit(source_img.crop(window), dither=dither)
+            canvas.paste(source_bw, (img_x + window[0], img_y + window[1]))
+            return canvas
+
+        if dither:
+            source_bw = _decode_data_url_image(image_data, mode="1")
+        else:
+            source_bw = _to_1bit(source_img, dither=False)
         canvas.paste(source_bw, (img_x, img_y))
         return canvas
 
@@ -1964,8 +2205,6 @@ def _build_combined_vector_points(job: dict, job_config: dict) -> Optional[dict]
     if not parse_bool(render_spec.get("vector_mixed", True)):
         return None
 
-    import numpy as np
-
     geometry = _job_shape_geometry(job, render_spec)
     vector_canvas = _rasterize_outline_canvas(geometry)
     black = np.array(vector_canvas, dtype=np.uint8) == 0
@@ -2048,9 +2287,8 @@ def _build_transmittable_bands(
     split into contiguous non-empty row bands and trim each band's columns.
     Center coordinates are adjusted so each band burns at the original position.
     """
-    import numpy as np
-
-    gray = np.array(image.convert("L"), dtype=np.uint8)
+    gray_img = image if image.mode == "L" else image.convert("L")
+    gray = np.asarray(gray_img, dtype=np.uint8)
     if gray.size == 0:
         return []
 
@@ -2122,53 +2360,79 @@ def _build_transmittable_bands(
 def report_summary():
     """Generate structured timing/statistics summary from a CSV log."""
     try:
-        import csv
-
         payload = _json_payload()
         csv_log = payload.get("csv_log", "")
         if not csv_log:
             return jsonify({"success": False, "error": "csv_log is required"}), 400
 
         csv_path = _safe_log_path(csv_log)
-        rows = []
         with open(csv_path, "r", newline="") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                rows.append(row)
+            reader = csv.reader(f)
+            header = next(reader, None)
+            rows = list(reader)
 
-        if not rows:
+        if not header or not rows:
             return jsonify({"success": False, "error": "Empty CSV log"}), 400
 
+        # Column-major view: one tuple per CSV column (short rows padded with "")
+        op_count = len(rows)
+        columns = list(zip_longest(*rows, fillvalue=""))
+        column_index = {name: idx for idx, name in enumerate(header)}
+
+        def column(name, default=""):
+            idx = column_index.get(name)
+            if idx is None or idx >= len(columns):
+                return (default,) * op_count
+            return columns[idx]
+
         def as_float(value, default=0.0):
             try:
                 return float(value)
             except (TypeError, ValueError):
                 return default
 
-        def as_int(value, default=0):
+        def float_column(name) -> list:
+            values = column(name)
             try:
-                return int(float(value))
-            except (TypeError, ValueError):
-                return default
+                # Whole-column C parse; any blank/bad cell falls back per value
+                return np.asarray(values, dtype=np.float64).tolist()
+            except ValueError:
+                return [as_float(v) for v in values]
+
+        def int_column(name) -> list:
+            values = np.asarray(float_column(name), dtype=np.float64)
+            return np.where(np.isfinite(values), values, 0).astype(np.int64).tolist()
+
+        phases = column("phase", "UNKNOWN")
+        operations = column("operation")
+        response_types = column("response_type")
+        status_pcts = column("status_pct")
+        durations_ms = float_column("duration_ms")
+        elapsed_values = float_column("elapsed_s")
+        bytes_values = int_column("bytes_transferred")
+        cumulative_values = int_column("cumulative_bytes")
 
         phase_stats = {}
         response_counts = {}
-        op_count = len(rows)
-        total_elapsed_s = max(as_float(r.get("elapsed_s", 0.0)) for r in rows)
-        total_bytes = max(as_int(r.get("cumulative_bytes", 0)) for r in rows)
+        # Running maxima, updated inside the single row pass below
+        total_elapsed_s = elapsed_values[0]
+        total_bytes = cumulative_values[0]
 
-        timeline = []
         chunk_timings = []
         status_series = []
 
-        for row in rows:
-            phase = row.get("phase", "UNKNOWN")
-            operation = row.get("operation", "")
-            duration_ms = as_float(row.get("duration_ms", 0))
-            elapsed_s = as_float(row.get("elapsed_s", 0))
-            bytes_transferred = as_int(row.get("bytes_transferred", 0))
-            response_type = row.get("response_type", "") or "NONE"
-            status_pct = row.get("status_pct", "")
+        for (
+            phase, operation, duration_ms, elapsed_s,
+            bytes_transferred, cumulative_bytes, response_type, status_pct,
+        ) in zip(
+            phases, operations, durations_ms, elapsed_values,
+            bytes_values, cumulative_values, response_types, status_pcts,
+        ):
+            response_type = response_type or "NONE"
+            if elapsed_s > total_elapsed_s:
+                total_elapsed_s = elapsed_s
+            if cumulative_bytes > total_bytes:
+                total_bytes = cumulative_bytes
 
             phase_entry = phase_stats.setdefault(phase, {"count": 0, "duration_ms": 0.0, "bytes": 0})
             phase_entry["count"] += 1
@@ -2177,14 +2441,6 @@ def report_summary():
 
             response_counts[response_type] = response_counts.get(response_type, 0) + 1
 
-            timeline.append({
-                "elapsed_s": round(elapsed_s, 3),
-                "phase": phase,
-                "operation": operation,
-                "duration_ms": round(duration_ms, 2),
-                "response_type": response_type,
-            })
-
             if "chunk" in operation.lower():
                 chunk_timings.append({
                     "elapsed_s": round(elapsed_s, 3),
@@ -2220,16 +2476,32 @@ def report_summary():
             "final_status_pct": status_series[-1]["pct"] if status_series else None,
         }
 
-        # Small timeline payload for UI performance on Pi.
-        timeline_sample = timeline[::max(1, len(timeline) // 400)]
+        # Small timeline payload for UI performance on Pi: slice the columns,
+        # then build dicts only for the sampled rows.
+        step = max(1, op_count // 400)
+        timeline_sample = [
+            {
+                "elapsed_s": round(elapsed_s, 3),
+                "phase": phase,
+                "operation": operation,
+                "duration_ms": round(duration_ms, 2),
+                "response_type": response_type or "NONE",
+            }
+            for elapsed_s, phase, operation, duration_ms, response_type in zip(
+                elapsed_values[::step],
+                phases[::step],
+                operations[::step],
+                durations_ms[::step],
+                response_types[::step],
+            )
+        ]
 
-        first = rows[0]
         report = {
             "success": True,
-            "schema_version": first.get("schema_version", "1.x"),
-            "run_id": first.get("run_id", ""),
-            "job_id": first.get("job_id", ""),
-            "burn_start": first.get("burn_start", ""),
+            "schema_version": column("schema_version", "1.x")[0],
+            "run_id": column("run_id")[0],
+            "job_id": column("job_id")[0],
+            "burn_start": column("burn_start")[0],
             "csv_log": str(csv_path),
             "summary": {
                 "operations": op_count,
@@ -2246,7 +2518,7 @@ def report_summary():
             },
             "timing_summary": timing_summary,
         }
-        return jsonify(report)
+        return _bulk_jsonify(report)
     except ValueError as e:
         return jsonify({"success": False, "error": str(e)}), 400
     except OSError as e:
@@ -2254,6 +2526,27 @@ def report_summary():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+# Commands around the DATA chunks: framing + header + 2 connects + 2 inits
+PROTOCOL_FRAMING_COMMANDS = 6
+
+
+@lru_cache(maxsize=64)
+def _estimate_protocol(width: int, height: int, vector_points: int = 0) -> dict:
+    """Lightweight protocol estimate for a width x height raster (shared; read-only)."""
+    bytes_per_line = (width + 7) // 8
+    vector_bytes = vector_points * 4
+    total_data_bytes = (bytes_per_line * height) + vector_bytes
+    total_chunks = -(-total_data_bytes // K6CommandBuilder.DATA_CHUNK)
+    return {
+        "bytes_per_line": bytes_per_line,
+        "total_data_bytes": total_data_bytes,
+        "vector_points": vector_points,
+        "vector_bytes": vector_bytes,
+        "total_chunks": total_chunks,
+        "estimated_commands": PROTOCOL_FRAMING_COMMANDS + total_chunks,
+    }
+
+
 @app.route("/api/job/preview", methods=["POST"])
 def job_preview():
     """Preview rendered burn jobs using same render path as /api/job/burn."""
@@ -2283,36 +2576,23 @@ def job_preview():
             center_x, center_y = _resolve_job_center(job, config)
             mixed_vector = _build_combined_vector_points(job, config)
             vector_points = len(mixed_vector["points"]) if mixed_vector else 0
-            vector_bytes = vector_points * 4
-
-            # Lightweight protocol estimate for debug visibility.
-            bytes_per_line = (img.width + 7) // 8
-            total_data_bytes = (bytes_per_line * img.height) + vector_bytes
-            total_chunks = (total_data_bytes + 1899) // 1900
-            estimated_commands = 1 + 1 + 2 + total_chunks + 2  # framing+header+connects+data+inits
+            width, height = img.size
 
             previews.append({
                 "job": name,
                 "render_mode": config.get("render_spec", {}).get("mode", "image_data"),
-                "preview_image": image_service.image_to_base64(img),
-                "width": img.width,
-                "height": img.height,
+                "preview_image": image_service.image_to_base64(img, fmt="WEBP"),
+                "width": width,
+                "height": height,
                 "center_x": center_x,
                 "center_y": center_y,
                     "power": safe_int(config.get("power", 1000), f"{name}.power", 0, 1000),
                     "depth": safe_int(config.get("depth", 100), f"{name}.depth", 1, 255),
-                "estimate": {
-                    "bytes_per_line": bytes_per_line,
-                    "total_data_bytes": total_data_bytes,
-                    "vector_points": vector_points,
-                    "vector_bytes": vector_bytes,
-                    "total_chunks": total_chunks,
-                    "estimated_commands": estimated_commands,
-                },
+                "estimate": _estimate_protocol(width, height, vector_points),
             })
 
         warnings = PreviewService.detect_warnings(job)
-        return jsonify({
+        return _bulk_jsonify({
             "success": True,
             "previews": previews,
             "warnings": warnings,
@@ -2340,8 +2620,7 @@ def job_burn():
             logger.warning("Pre-burn HOME failed; continuing with job execution")
         
         # Clear cancel flag
-        global burn_cancel_event
-        burn_cancel_event.clear()
+        burn_cancel_flag[0] = False
         
         job_data = _json_payload()
         job = job_data.get("job", {})
@@ -2365,9 +2644,7 @@ def job_burn():
         run_id = str(uuid4())
         
         for job_name, job_config in enabled_jobs.items():
-            timestamp = file_timestamp()
-
-            try:
+            with _deferred_discards():
                 # Render from metadata when available; fallback to legacy image_data.
                 if "render_spec" in job_config:
                     rendered_img = _render_job_image(job, job_config)
@@ -2415,7 +2692,6 @@ def job_burn():
                     )
 
                 for band_idx, band in enumerate(bands, start=1):
-                    band_temp_path = DATA_DIR / f"job_{job_name}_{timestamp}_b{band_idx}.png"
                     vector_payload = b""
                     vector_point_count = 0
                     vector_width = 0
@@ -2426,29 +2702,25 @@ def job_burn():
                             band["bbox"],
                         )
 
-                    try:
-                        band["image"].save(band_temp_path)
-                        response, status_code = _run_burn_with_csv(
-                            image_path=str(band_temp_path),
-                            power=power,
-                            depth=depth,
-                            center_x=band["center_x"],
-                            center_y=band["center_y"],
-                            csv_prefix=f"job_{job_name}_b{band_idx}",
-                            job_id=f"{job_name}_b{band_idx}",
-                            dry_run_override=effective_dry_run,
-                            setup_message=f"Initializing job {job_name} ({band_idx}/{len(bands)})",
-                            complete_message_template=None,
-                            emit_error=False,
-                            vector_payload=vector_payload,
-                            vector_width=vector_width if vector_point_count > 0 else 0,
-                            vector_height=vector_height if vector_point_count > 0 else 0,
-                            vector_power=power if vector_point_count > 0 else 0,
-                            vector_depth=depth if vector_point_count > 0 else 0,
-                            vector_point_count=vector_point_count,
-                        )
-                    finally:
-                        band_temp_path.unlink(missing_ok=True)
+                    response, status_code = _run_burn_with_csv(
+                        image=band["image"],
+                        power=power,
+                        depth=depth,
+                        center_x=band["center_x"],
+                        center_y=band["center_y"],
+                        csv_prefix=f"job_{job_name}_b{band_idx}",
+                        job_id=f"{job_name}_b{band_idx}",
+                        dry_run_override=effective_dry_run,
+                        setup_message=f"Initializing job {job_name} ({band_idx}/{len(bands)})",
+                        complete_message_template=None,
+                        emit_error=False,
+                        vector_payload=vector_payload,
+                        vector_width=vector_width if vector_point_count > 0 else 0,
+                        vector_height=vector_height if vector_point_count > 0 else 0,
+                        vector_power=power if vector_point_count > 0 else 0,
+                        vector_depth=depth if vector_point_count > 0 else 0,
+                        vector_point_count=vector_point_count,
+                    )
 
                     band_success = status_code == 200 and response.get("success", False)
                     if response.get("csv_log"):
@@ -2492,8 +2764,6 @@ def job_burn():
                     break  # Stop on first failure
                 else:
                     emit_progress("complete", 100, f"{job_name} complete")
-            finally:
-                pass
         
         # Check if all succeeded
         all_success = all(r["success"] for r in results)
@@ -2518,12 +2788,11 @@ def job_burn():
 
 
 @app.route("/api/calibration/burn", methods=["POST"])
-def calibration_burn():  # noqa: C901
+def calibration_burn():
     """Burn calibration pattern"""
     try:
         # Clear cancel flag at start of new burn
-        global burn_cancel_event
-        burn_cancel_event.clear()
+        burn_cancel_flag[0] = False
 
         # Re-home the device before starting new burn (in case STOP was pressed)
         try:
@@ -2538,113 +2807,8 @@ def calibration_burn():  # noqa: C901
         power = safe_int(data.get("power", 500), "power", 0, 1000)
         depth = safe_int(data.get("depth", 10), "depth", 1, 255)
 
-        # Validate
-        power = _clamp_int(power, 0, 1000)
-        depth = _clamp_int(depth, 1, 255)
-
-        def mm_to_px(mm: float) -> int:
-            return int(round(mm / resolution))
-
-        # Generate pattern
-        if pattern == "center":
-            size_px = mm_to_px(size_mm)
-            work_area_px = mm_to_px(80.0)
-
-            # Create small box
-            box = Image.new("1", (size_px, size_px), 1)
-            draw_box = ImageDraw.Draw(box)
-            draw_box.rectangle((0, 0, size_px - 1, size_px - 1), outline=0, width=2)
-            center = size_px // 2
-            cross_half = mm_to_px(2.5)
-            draw_box.line(
-                (center - cross_half, center, center + cross_half, center),
-                fill=0,
-                width=1,
-            )
-            draw_box.line(
-                (center, center - cross_half, center, center + cross_half),
-                fill=0,
-                width=1,
-            )
-
-            # Center it in full work area
-            img = Image.new("1", (work_area_px, work_area_px), 1)
-            offset = (work_area_px - size_px) // 2
-            img.paste(box, (offset, offset))
-
-        elif pattern == "corners":
-            work_area_px = mm_to_px(80.0)
-            box_px = mm_to_px(size_mm)
-            img = Image.new("1", (work_area_px, work_area_px), 1)
-            box = Image.new("1", (box_px, box_px), 1)
-            draw_box = ImageDraw.Draw(box)
-            draw_box.rectangle((0, 0, box_px - 1, box_px - 1), outline=0, width=2)
-            positions = [
-                (0, 0),
-                (work_area_px - box_px, 0),
-                (0, work_area_px - box_px),
-                (work_area_px - box_px, work_area_px - box_px),
-            ]
-            for x, y in positions:
-                img.paste(box, (x, y))
-            draw = ImageDraw.Draw(img)
-            draw.rectangle(
-                (0, 0, work_area_px - 1, work_area_px - 1), outline=0, width=1
-            )
-
-        elif pattern == "frame":
-            size_px = mm_to_px(80.0)
-            img = Image.new("1", (size_px, size_px), 1)
-            draw = ImageDraw.Draw(img)
-            draw.rectangle((0, 0, size_px - 1, size_px - 1), outline=0, width=2)
-
-        elif pattern == "grid":
-            # Graph paper pattern - configurable grid spacing covering work area
-            work_area_px = mm_to_px(80.0)
-            grid_spacing_px = mm_to_px(size_mm)
-
-            img = Image.new("1", (work_area_px, work_area_px), 1)
-            draw = ImageDraw.Draw(img)
-
-            # Draw vertical lines
-            x = 0
-            while x <= work_area_px:
-                draw.line((x, 0, x, work_area_px - 1), fill=0, width=1)
-                x += grid_spacing_px
-
-            # Draw horizontal lines
-            y = 0
-            while y <= work_area_px:
-                draw.line((0, y, work_area_px - 1, y), fill=0, width=1)
-                y += grid_spacing_px
-
-            # Draw border thicker
-            draw.rectangle(
-                (0, 0, work_area_px - 1, work_area_px - 1), outline=0, width=2
-            )
-
-        elif pattern == "bottom-test":
-            # Bottom-out test: diagonal line in bottom 1/8th of Y-axis work area
-            # Full 1600x1600px to test Y-axis limits and find bottom edge cropping
-            work_area_px = mm_to_px(80.0)
-            
-            img = Image.new("1", (work_area_px, work_area_px), 1)
-            draw = ImageDraw.Draw(img)
-            
-            # Calculate bottom 1/8th region (last 200px of 1600px)
-            bottom_eighth = work_area_px // 8  # 200px
-            start_y = work_area_px - bottom_eighth  # y=1400
-            
-            # Draw diagonal line from top-left to bottom-right of bottom 1/8th region
-            # From (0, 1400) to (1600, 1600)
-            draw.line(
-                (0, start_y, work_area_px - 1, work_area_px - 1),
-                fill=0,
-                width=3
-            )
-
-        else:
-            return jsonify({"success": False, "error": "Invalid pattern"}), 400
+        # Same renderer as /api/calibration/generate, so the burn matches the preview
+        img = PatternService.generate(str(pattern), resolution, size_mm)
 
         # Calculate center coordinates for positioning
         # Work area: 1600x1520px (76mm actual Y-axis, not 80mm)
@@ -2657,11 +2821,6 @@ def calibration_burn():  # noqa: C901
             # Default: center in work area
             center_y = K6_CENTER_Y
 
-        # Save and burn
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            img.save(tmp.name)
-            tmp_path = tmp.name
-
         # Emit start event
         emit_progress("start", 0, f"Starting {pattern} pattern burn")
         emit_progress(
@@ -2670,52 +2829,45 @@ def calibration_burn():  # noqa: C901
             f"Image: {img.width}x{img.height}px, Power: {power}, Depth: {depth}",
         )
         emit_progress(
-            "prepare", 50, "Processing image with NumPy (~5-10 sec for 1600x1600)..."
+            "prepare", 50, "Processing image with NumPy..."
         )
 
-        try:
-            response, status_code = _run_burn_with_csv(
-                image_path=tmp_path,
-                power=power,
-                depth=depth,
-                center_x=center_x,
-                center_y=center_y,
-                csv_prefix=f"calibration-{pattern}-{resolution}mm",
-                job_id=f"calibration_{pattern}",
-                setup_message="Image processing complete, starting protocol...",
-                complete_message_template="Burn complete in {total_time:.1f}s",
-                emit_error=True,
+        # Burn in-memory pattern (no PNG round trip)
+        response, status_code = _run_burn_with_csv(
+            image=img,
+            power=power,
+            depth=depth,
+            center_x=center_x,
+            center_y=center_y,
+            csv_prefix=f"calibration-{pattern}-{resolution}mm",
+            job_id=f"calibration_{pattern}",
+            setup_message="Image processing complete, starting protocol...",
+            complete_message_template="Burn complete in {total_time:.1f}s",
+            emit_error=True,
+        )
+        if status_code == 200:
+            response.update(
+                {
+                    "pattern": pattern,
+                    "resolution": resolution,
+                    "size_mm": size_mm,
+                    "width_px": img.width,
+                    "height_px": img.height,
+                    "power": power,
+                    "depth": depth,
+                }
             )
-            if status_code == 200:
-                response.update(
-                    {
-                        "pattern": pattern,
-                        "resolution": resolution,
-                        "size_mm": size_mm,
-                        "width_px": img.width,
-                        "height_px": img.height,
-                        "power": power,
-                        "depth": depth,
-                    }
-                )
-            return jsonify(response), status_code
-
-        finally:
-            Path(tmp_path).unlink(missing_ok=True)
+        return jsonify(response), status_code
 
     except KeyboardInterrupt:
         logger.info("Calibration burn cancelled by user")
         emit_progress("stopped", 0, "Burn cancelled")
-        if "tmp_path" in locals():
-            Path(tmp_path).unlink(missing_ok=True)
         return jsonify({"success": False, "error": "Cancelled by user"}), 400
     except ValueError as e:
         return jsonify({"success": False, "error": str(e)}), 400
     except (RuntimeError, OSError) as e:
         logger.error(f"Calibration burn failed: {e}")
         emit_progress("error", 0, str(e))
-        if "tmp_path" in locals():
-            Path(tmp_path).unlink(missing_ok=True)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
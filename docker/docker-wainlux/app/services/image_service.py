@@ -2,10 +2,43 @@
 
 import numpy as np
 from PIL import Image
+import base64
 import io
 import subprocess
-import tempfile
-from pathlib import Path
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional
+
+try:
+    import cairosvg
+except (ImportError, OSError):  # optional; OSError = libcairo missing
+    cairosvg = None
+
+# White canvas fill per image mode (anything else falls back to "white")
+WHITE_FILL = {"1": 255, "L": 255, "RGB": (255, 255, 255), "RGBA": (255, 255, 255, 255)}
+
+# Encoded preview data URLs keyed by (caller cache_key, format, lossless).
+# Callers that render deterministically from their parameters (calibration
+# and alignment patterns) pass those parameters as the key; nothing is hashed.
+PREVIEW_CACHE_MAX = 16
+_preview_cache: OrderedDict[tuple, str] = OrderedDict()
+_preview_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _have_inkscape() -> bool:
+    """Probe `inkscape --version` once per process (the answer never changes)."""
+    try:
+        result = subprocess.run(
+            ['inkscape', '--version'],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return False
+    return result.returncode == 0
 
 
 class ImageService:
@@ -83,8 +116,11 @@ class ImageService:
 
     @staticmethod
     def svg_to_png(svg_path: str, width: int = 800, dpi: int = 96) -> Image.Image:
-        """Convert SVG to PNG using Inkscape.
-        
+        """Convert SVG to PNG in-process with CairoSVG, else via Inkscape.
+
+        CairoSVG renders straight to memory (no fork/exec, no temp file);
+        the Inkscape subprocess is the fallback when it is not installed.
+
         Args:
             svg_path: Path to SVG file
             width: Target width in pixels (height auto-calculated from aspect ratio)
@@ -94,58 +130,57 @@ class ImageService:
             PIL Image (RGB mode)
             
         Raises:
-            RuntimeError: If Inkscape not available or conversion fails
+            RuntimeError: If no converter is available or conversion fails
         """
-        try:
-            # Check for Inkscape
-            result = subprocess.run(
-                ['inkscape', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode != 0:
-                raise RuntimeError("Inkscape not available")
-                
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        if cairosvg is not None:
+            try:
+                # White background for laser (burn=black on white)
+                png_bytes = cairosvg.svg2png(
+                    url=svg_path,
+                    output_width=width,
+                    dpi=dpi,
+                    background_color="white",
+                )
+            except Exception as e:  # parse/render errors have no common base
+                raise RuntimeError(f"SVG conversion failed: {e}") from e
+            return Image.open(io.BytesIO(png_bytes))
+
+        if not _have_inkscape():
             raise RuntimeError("Inkscape not installed. Install: apt-get install inkscape")
-        
-        # Create temp PNG file
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-            png_path = tmp.name
-        
+
+        # Convert SVG → PNG using Inkscape, PNG streamed to stdout (no temp file)
+        # --export-width sets width, height auto-scaled
+        # --export-background=white for laser (burn=black on white)
         try:
-            # Convert SVG → PNG using Inkscape
-            # --export-width sets width, height auto-scaled
-            # --export-background=white for laser (burn=black on white)
             result = subprocess.run(
                 [
                     'inkscape',
                     svg_path,
                     '--export-type=png',
-                    f'--export-filename={png_path}',
+                    '--export-filename=-',
                     f'--export-width={width}',
                     '--export-background=white',
                     '--export-background-opacity=1.0'
                 ],
                 capture_output=True,
-                text=True,
                 timeout=30
             )
-            
-            if result.returncode != 0:
-                raise RuntimeError(f"Inkscape conversion failed: {result.stderr}")
-            
-            # Load PNG
-            img = Image.open(png_path)
-            return img
-            
-        finally:
-            # Clean up temp file
-            Path(png_path).unlink(missing_ok=True)
-    
+        except subprocess.TimeoutExpired as e:
+            raise RuntimeError("Inkscape conversion timed out") from e
+
+        if result.returncode != 0 or not result.stdout:
+            stderr = result.stderr.decode(errors="replace")
+            raise RuntimeError(f"Inkscape conversion failed: {stderr}")
+
+        return Image.open(io.BytesIO(result.stdout))
+
     @staticmethod
-    def image_to_base64(img: Image.Image) -> str:
+    def image_to_base64(
+        img: Image.Image,
+        fmt: str = "PNG",
+        lossless: bool = True,
+        cache_key: Optional[tuple] = None,
+    ) -> str:
         """Convert PIL Image to base64 data URL for preview.
         
         Generic preview conversion - works for ANY image (QR, calibration, uploads).
@@ -153,16 +188,48 @@ class ImageService:
         
         Args:
             img: PIL Image to convert
+            fmt: "PNG" (default) or "WEBP" for display-only previews. 1-bit
+                 images always use PNG (smaller and faster than WebP there).
+            lossless: WebP lossless mode (ignored for PNG)
+            cache_key: Hashable parameters that fully determine img (e.g.
+                pattern, resolution, size). Given one, the encoded data URL
+                is cached under it; without one, nothing is cached.
             
         Returns:
             Base64 data URL string
         """
-        import base64
-        
+        fmt = fmt.upper()
+        key = None
+        if cache_key is not None:
+            key = (cache_key, fmt, lossless)
+            with _preview_cache_lock:
+                data_url = _preview_cache.get(key)
+                if data_url is not None:
+                    _preview_cache.move_to_end(key)
+                    return data_url
+
         buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        img_base64 = base64.b64encode(buffer.getvalue()).decode()
-        return f"data:image/png;base64,{img_base64}"
+        if fmt == "WEBP" and img.mode != "1":
+            # method=0: fastest encoder effort; still ~40% smaller than PNG on photos
+            img.save(buffer, format="WEBP", lossless=lossless, method=0)
+            mime = "image/webp"
+        else:
+            # Level 1: most of the default level 6 deflate time is spent for a
+            # few % on typical previews; still lossless
+            img.save(buffer, format="PNG", compress_level=1)
+            mime = "image/png"
+        # getbuffer(): memoryview over the encoded PNG/WebP, no getvalue() copy
+        img_base64 = base64.b64encode(buffer.getbuffer()).decode("ascii")
+        data_url = f"data:{mime};base64,{img_base64}"
+        if key is None:
+            return data_url
+
+        with _preview_cache_lock:
+            _preview_cache[key] = data_url
+            _preview_cache.move_to_end(key)
+            while len(_preview_cache) > PREVIEW_CACHE_MAX:
+                _preview_cache.popitem(last=False)
+        return data_url
 
     @staticmethod
     def center_image_at(img: Image.Image, target_width: int, target_height: int,
@@ -182,10 +249,6 @@ class ImageService:
         Returns:
             PIL Image on white canvas, centered at specified coordinates
         """
-        # Create canvas matching input mode
-        canvas = Image.new(img.mode, (target_width, target_height), 
-                          255 if img.mode in ("1", "L") else "white")
-        
         # Calculate paste position (top-left corner)
         paste_x = center_x - (img.width // 2)
         paste_y = center_y - (img.height // 2)
@@ -201,6 +264,10 @@ class ImageService:
                 f"Image extends beyond canvas bottom-right: "
                 f"paste=({paste_x},{paste_y}), size={img.size}, canvas=({target_width},{target_height})"
             )
-        
+
+        # Allocate only once the position is valid; numeric fills for the
+        # common modes skip the color-name lookup
+        fill = WHITE_FILL.get(img.mode, "white")
+        canvas = Image.new(img.mode, (target_width, target_height), fill)
         canvas.paste(img, (paste_x, paste_y))
         return canvas
@@ -1,7 +1,10 @@
 """K6 laser device service for managing device operations"""
 
 from typing import Optional
+import binascii
+import atexit
 import logging
+import queue
 import threading
 import time
 
@@ -11,9 +14,56 @@ from k6.driver import WainluxK6
 from k6.transport import SerialTransport, MockTransport
 from k6 import protocol
 from k6.byte_logger import ByteDumpLogger
+from utils.timestamps import file_timestamp, iso_timestamp
 
 logger = logging.getLogger(__name__)
 
+# Characters parse_hex_bytes ignores between hex digits
+_HEX_SEPARATORS = b" ,\t\r\n\v\f"
+
+# Byte-dump writes (flush per entry) are handed to one daemon thread so SD
+# card latency never lands on the serial path. Items are
+# (ByteDumpLogger, method_name, *args); entries carry the timestamp taken at
+# send/receive time, and "close" runs after earlier writes. None stops the
+# worker. The thread starts on first use and is drained at interpreter exit.
+_logger_queue: "queue.SimpleQueue[Optional[tuple]]" = queue.SimpleQueue()
+_logger_thread: Optional[threading.Thread] = None
+_logger_thread_lock = threading.Lock()
+
+
+def _byte_logger_worker() -> None:
+    """Drain _logger_queue until the None sentinel, dispatching to each ByteDumpLogger."""
+    while True:
+        item = _logger_queue.get()
+        if item is None:
+            return
+        byte_logger, method, *args = item
+        try:
+            getattr(byte_logger, method)(*args)
+        except Exception as e:
+            logger.warning(f"Byte logger {method} failed: {e}")
+
+
+def _queue_byte_log(*item) -> None:
+    """Queue a ByteDumpLogger call, starting the writer thread on first use."""
+    global _logger_thread
+    if _logger_thread is None:
+        with _logger_thread_lock:
+            if _logger_thread is None:
+                _logger_thread = threading.Thread(
+                    target=_byte_logger_worker, name="k6-byte-logger", daemon=True
+                )
+                _logger_thread.start()
+                atexit.register(_flush_byte_logs)
+    _logger_queue.put(item)
+
+
+def _flush_byte_logs(timeout: float = 5.0) -> None:
+    """Write out queued byte-dump entries before the interpreter exits."""
+    if _logger_thread is not None and _logger_thread.is_alive():
+        _logger_queue.put(None)
+        _logger_thread.join(timeout)
+
 
 class K6DeviceManager:
     """Manages K6 device connection and state"""
@@ -23,7 +73,9 @@ class K6DeviceManager:
         self.connected = False
         self.version: Optional[str] = None
         self._dry_run = False  # Driver-level dry run toggle
-        self.serial_lock = threading.RLock()
+        # Plain Lock: no holder ever re-enters (engrave, raw_send and the
+        # pipeline execute in main.py each take it once around the transport)
+        self.serial_lock = threading.Lock()
         self.mock_mode = os.getenv("K6_MOCK_DEVICE", "false").lower() == "true"
         
         # Initialize transport based on mock mode
@@ -119,20 +171,26 @@ class K6Service:
         if not packet_hex or not isinstance(packet_hex, str):
             raise ValueError("packet_hex is required")
 
-        normalized = (
-            packet_hex.replace("0x", "")
-            .replace("0X", "")
-            .replace(",", " ")
-            .replace("\n", " ")
-            .strip()
-        )
-        hex_text = "".join(normalized.split())
-        if len(hex_text) % 2 != 0:
+        # Compact or space-separated pairs (what the MCP tool sends) parse as-is
+        try:
+            return bytes.fromhex(packet_hex)
+        except ValueError:
+            pass
+
+        # Work on ASCII bytes: bytes.translate deletes separators in one C
+        # pass (str.translate's delete path is a per-char mapping lookup)
+        try:
+            hex_bytes = packet_hex.encode("ascii")
+        except UnicodeEncodeError as exc:
+            raise ValueError(f"Invalid hex payload: {exc}") from exc
+        hex_bytes = hex_bytes.replace(b"0x", b"").replace(b"0X", b"")
+        hex_bytes = hex_bytes.translate(None, _HEX_SEPARATORS)
+        if len(hex_bytes) % 2 != 0:
             raise ValueError("Hex payload must contain an even number of characters")
 
         try:
-            return bytes.fromhex(hex_text)
-        except ValueError as exc:
+            return binascii.unhexlify(hex_bytes)
+        except binascii.Error as exc:
             raise ValueError(f"Invalid hex payload: {exc}") from exc
 
     def raw_send(
@@ -158,13 +216,11 @@ class K6Service:
         settle_ms = max(10, min(int(settle_ms), 1000))
 
         byte_logger = None
-        response = bytearray()
-        tx_time = time.time()
+        tx_ns = time.monotonic_ns()
 
         try:
             if log_prefix:
-                timestamp = time.strftime("%Y%m%d_%H%M%S")
-                base_path = f"{log_prefix}_{timestamp}"
+                base_path = f"{log_prefix}_{file_timestamp()}"
                 byte_logger = ByteDumpLogger(base_path)
 
             with self.device.serial_lock:
@@ -174,46 +230,64 @@ class K6Service:
                 transport.set_timeout(timeout)
 
                 if byte_logger:
-                    byte_logger.log_send(payload, "RAW_SEND")
+                    _queue_byte_log(byte_logger, "log_send", payload, "RAW_SEND", iso_timestamp())
                 bytes_written = transport.write(payload)
+                rx = K6Service._drain(transport, timeout, settle_ms, read_size)
+                rx_timestamp = iso_timestamp() if byte_logger else None
 
-                deadline = time.time() + timeout
-                idle_deadline = time.time() + (settle_ms / 1000.0)
-                while time.time() < deadline and len(response) < read_size:
-                    chunk = transport.read(1)
-                    if chunk:
-                        response.extend(chunk)
-                        idle_deadline = time.time() + (settle_ms / 1000.0)
-                    elif response and time.time() >= idle_deadline:
-                        break
+            # Lock released: logging and parsing only touch the local copy
+            if byte_logger and rx:
+                _queue_byte_log(byte_logger, "log_recv", rx, rx_timestamp)
 
-                if byte_logger and response:
-                    byte_logger.log_recv(bytes(response))
-
-            hb_count, ack_count, response_type = protocol.parse_response_frames(bytes(response))
+            hb_count, ack_count, response_type = protocol.parse_response_frames(rx)
             return True, {
                 "success": True,
                 "tx_hex": payload.hex(),
                 "tx_len": len(payload),
                 "bytes_written": bytes_written,
-                "rx_hex": bytes(response).hex(),
-                "rx_len": len(response),
+                "rx_hex": rx.hex(),
+                "rx_len": len(rx),
                 "response_type": response_type,
                 "ack_count": ack_count,
                 "heartbeat_count": hb_count,
                 "timeout": timeout,
                 "read_size": read_size,
                 "flush_input": flush_input,
-                "elapsed_ms": round((time.time() - tx_time) * 1000, 2),
+                "elapsed_ms": round((time.monotonic_ns() - tx_ns) / 1e6, 2),
             }
         except Exception as e:
             logger.error(f"Raw send failed: {e}")
             if byte_logger:
-                byte_logger.log_error(str(e))
+                _queue_byte_log(byte_logger, "log_error", str(e), iso_timestamp())
             return False, {"success": False, "error": str(e)}
         finally:
             if byte_logger:
-                byte_logger.close()
+                # Queued behind this call's writes; the worker closes the files
+                _queue_byte_log(byte_logger, "close")
+
+    @staticmethod
+    def _drain(transport, timeout: float, settle_ms: int, read_size: int) -> bytes:
+        """Collect a raw_send response (caller holds the serial lock).
+
+        Waits up to `timeout` for the first byte, then takes whatever the
+        driver has buffered (in_waiting) in one read. Only an empty buffer
+        blocks, for a single byte up to settle_ms; an empty read means the
+        line went quiet. pyserial's read(n) would otherwise sit out the full
+        settle window whenever fewer than n bytes arrive. Kept out of raw_send
+        so the read loop shows up as its own frame in profiles.
+        """
+        deadline_ns = time.monotonic_ns() + int(timeout * 1e9)
+        response = bytearray(transport.read(1))
+        if response:
+            transport.set_timeout(settle_ms / 1000.0)
+            while len(response) < read_size and time.monotonic_ns() < deadline_ns:
+                waiting = transport.in_waiting
+                chunk = transport.read(min(waiting, read_size - len(response)) if waiting else 1)
+                if not chunk:
+                    break
+                response += chunk
+            transport.set_timeout(timeout)
+        return bytes(response)
 
     def draw_bounds(self, width: int = 1600, height: int = 1520, 
                     center_x: int = 800, center_y: int = 760) -> bool:
@@ -254,7 +328,7 @@ class K6Service:
             protocol.send_cmd_checked(
                 self.device.transport,
                 "FRAMING (stop preview)",
-                bytes([0x21, 0x00, 0x04, 0x00]),
+                protocol.CMD_FRAMING_STOP,
                 timeout=2.0,
                 expect_ack=True,
             )
@@ -263,7 +337,7 @@ class K6Service:
             protocol.send_cmd_checked(
                 self.device.transport,
                 "HOME",
-                bytes([0x17, 0x00, 0x04, 0x00]),
+                protocol.CMD_HOME,
                 timeout=10.0,
                 expect_ack=True,
             )
@@ -283,6 +357,9 @@ class K6Service:
         Returns:
             Tuple of (success, result_dict)
         """
+        if not self.device.is_connected():
+            return False, {"success": False, "error": "Device not connected"}
+
         try:
             # Use BOUNDS with 1x1px to position laser
             success = self.device.driver.draw_bounds_transport(
@@ -317,6 +394,9 @@ class K6Service:
         Returns:
             Tuple of (success, result_dict)
         """
+        if not self.device.is_connected():
+            return False, {"success": False, "error": "Device not connected"}
+
         try:
             success = self.device.driver.mark_position_transport(
                 self.device.transport,
@@ -350,13 +430,13 @@ class K6Service:
             Tuple of (success, result_dict)
         """
         try:
-            opcode = 0x06 if enable else 0x07
+            command = protocol.CMD_CROSSHAIR_ON if enable else protocol.CMD_CROSSHAIR_OFF
             cmd_name = "CROSSHAIR ON" if enable else "CROSSHAIR OFF"
 
             protocol.send_cmd_checked(
                 self.device.transport,
                 cmd_name,
-                bytes([opcode, 0x00, 0x04, 0x00]),
+                command,
                 timeout=2.0,
                 expect_ack=True,
             )
@@ -380,13 +460,13 @@ class K6Service:
 
         try:
             # Send STOP command
-            self.device.transport.write(bytes([0x16, 0x00, 0x04, 0x00]))
+            self.device.transport.write(protocol.CMD_STOP)
             
             # Send CONNECT to reset device state
             protocol.send_cmd_checked(
                 self.device.transport,
                 "CONNECT #1",
-                bytes([0x0A, 0x00, 0x04, 0x00]),
+                protocol.CMD_CONNECT,
                 timeout=2.0,
                 expect_ack=True,
             )
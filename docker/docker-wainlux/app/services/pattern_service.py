@@ -1,14 +1,26 @@
 """Pattern generation service for calibration and testing"""
 
+from functools import lru_cache, partial
+
+import numpy as np
 from PIL import Image, ImageDraw
 
+# Rendered patterns per distinct argument tuple. Inputs come from a handful of
+# UI presets, so repeat previews/alignment boxes skip the redraw.
+PATTERN_CACHE_MAX = 16
+
+
+def _mm_to_px(mm: float, resolution: float) -> int:
+    return int(round(mm / resolution))
+
 
 class PatternService:
     """Generate test patterns for calibration"""
 
     @staticmethod
+    @lru_cache(maxsize=PATTERN_CACHE_MAX)
     def generate(pattern: str, resolution: float = 0.05, size_mm: float = 10.0) -> Image.Image:
-        """Generate calibration pattern.
+        """Generate calibration pattern (cached; shared image, do not mutate).
         
         Args:
             pattern: Pattern type (center, corners, frame, grid, bottom-test)
@@ -18,8 +30,7 @@ class PatternService:
         Returns:
             PIL Image in mode "1" (1-bit black/white)
         """
-        def mm_to_px(mm: float) -> int:
-            return int(round(mm / resolution))
+        mm_to_px = partial(_mm_to_px, resolution=resolution)
 
         if pattern == "center":
             return PatternService._center(mm_to_px, size_mm)
@@ -34,6 +45,67 @@ class PatternService:
         else:
             raise ValueError(f"Unknown pattern: {pattern}")
 
+    @staticmethod
+    def outline(canvas: np.ndarray, box, width: int = 1) -> None:
+        """Stamp a rectangle outline into a 1-bit canvas (False = black), in place.
+
+        Matches ImageDraw.rectangle(box, outline=0, width=width) pixel for pixel,
+        including clipping, using four slice assignments instead of draw calls.
+
+        Args:
+            canvas: 2-D bool array (height, width), True = white
+            box: (x0, y0, x1, y1) inclusive; float coordinates are truncated
+            width: Border width in pixels, drawn inward
+        """
+        x0, y0, x1, y1 = (int(v) for v in box)
+        if x1 - x0 + 1 < 2 * width or y1 - y0 + 1 < 2 * width:
+            # Border thicker than the box: defer to Pillow's own fill rules
+            img = Image.fromarray(canvas)
+            ImageDraw.Draw(img).rectangle(box, outline=0, width=width)
+            canvas[...] = np.asarray(img)
+            return
+
+        height, canvas_width = canvas.shape
+        for top, bottom, left, right in (
+            (y0, y0 + width - 1, x0, x1),
+            (y1 - width + 1, y1, x0, x1),
+            (y0, y1, x0, x0 + width - 1),
+            (y0, y1, x1 - width + 1, x1),
+        ):
+            top, left = max(top, 0), max(left, 0)
+            bottom, right = min(bottom, height - 1), min(right, canvas_width - 1)
+            if top <= bottom and left <= right:
+                canvas[top:bottom + 1, left:right + 1] = False
+
+    @staticmethod
+    def _paste_outline(img: Image.Image, box, width: int = 1) -> None:
+        """Paint a rectangle outline (black) onto a PIL image, in place.
+
+        Same pixels as ImageDraw.rectangle(box, outline=0, width=width), as four
+        flat-color pastes of the border strips.
+        """
+        x0, y0, x1, y1 = (int(v) for v in box)
+        if x1 - x0 + 1 < 2 * width or y1 - y0 + 1 < 2 * width:
+            ImageDraw.Draw(img).rectangle(box, outline=0, width=width)
+            return
+        for strip in (
+            (x0, y0, x1 + 1, y0 + width),
+            (x0, y1 - width + 1, x1 + 1, y1 + 1),
+            (x0, y0, x0 + width, y1 + 1),
+            (x1 - width + 1, y0, x1 + 1, y1 + 1),
+        ):
+            img.paste(0, strip)
+
+    @staticmethod
+    def paste(canvas: np.ndarray, tile: np.ndarray, x: int, y: int) -> None:
+        """Copy tile into canvas at (x, y) with Image.paste-style clipping."""
+        height, width = canvas.shape
+        tile_height, tile_width = tile.shape
+        left, top = max(x, 0), max(y, 0)
+        right, bottom = min(x + tile_width, width), min(y + tile_height, height)
+        if left < right and top < bottom:
+            canvas[top:bottom, left:right] = tile[top - y:bottom - y, left - x:right - x]
+
     @staticmethod
     def _center(mm_to_px, size_mm: float) -> Image.Image:
         """Center pattern: small box with crosshair, centered in work area"""
@@ -42,8 +114,8 @@ class PatternService:
         
         # Small box
         box = Image.new("1", (size_px, size_px), 1)
+        PatternService._paste_outline(box, (0, 0, size_px - 1, size_px - 1), width=2)
         draw = ImageDraw.Draw(box)
-        draw.rectangle((0, 0, size_px - 1, size_px - 1), outline=0, width=2)
         
         # Crosshairs
         center = size_px // 2
@@ -63,45 +135,46 @@ class PatternService:
         box_px = mm_to_px(size_mm)
         img = Image.new("1", (work_area_px, work_area_px), 1)
 
-        # Create box template
-        box = Image.new("1", (box_px, box_px), 1)
-        draw_box = ImageDraw.Draw(box)
-        draw_box.rectangle((0, 0, box_px - 1, box_px - 1), outline=0, width=2)
-
-        # Place in corners
+        # Boxed corners: outline strips straight onto the canvas. Overlapping
+        # boxes (wider than half the work area) and boxes too small for a 2px
+        # border paste a white-interior template so later boxes cover earlier ones.
+        box = None
+        if 2 * box_px > work_area_px or box_px < 4:
+            box = Image.new("1", (box_px, box_px), 1)
+            PatternService._paste_outline(box, (0, 0, box_px - 1, box_px - 1), width=2)
         for x, y in [(0, 0), (work_area_px - box_px, 0), 
                      (0, work_area_px - box_px), (work_area_px - box_px, work_area_px - box_px)]:
-            img.paste(box, (x, y))
+            if box is None:
+                PatternService._paste_outline(img, (x, y, x + box_px - 1, y + box_px - 1), width=2)
+            else:
+                img.paste(box, (x, y))
 
         # Border
-        draw = ImageDraw.Draw(img)
-        draw.rectangle((0, 0, work_area_px - 1, work_area_px - 1), outline=0, width=1)
+        PatternService._paste_outline(img, (0, 0, work_area_px - 1, work_area_px - 1), width=1)
         return img
 
     @staticmethod
     def _frame(mm_to_px) -> Image.Image:
         size_px = mm_to_px(80.0)
         img = Image.new("1", (size_px, size_px), 1)
-        draw = ImageDraw.Draw(img)
-        draw.rectangle((0, 0, size_px - 1, size_px - 1), outline=0, width=2)
+        PatternService._paste_outline(img, (0, 0, size_px - 1, size_px - 1), width=2)
         return img
 
     @staticmethod
     def _grid(mm_to_px, size_mm: float) -> Image.Image:
         work_area_px = mm_to_px(80.0)
         grid_spacing_px = mm_to_px(size_mm)
-        img = Image.new("1", (work_area_px, work_area_px), 1)
-        draw = ImageDraw.Draw(img)
+        if grid_spacing_px < 1:
+            raise ValueError("size_mm too small for grid spacing")
 
-        # Vertical + horizontal lines
-        for x in range(0, work_area_px + 1, grid_spacing_px):
-            draw.line((x, 0, x, work_area_px - 1), fill=0, width=1)
-        for y in range(0, work_area_px + 1, grid_spacing_px):
-            draw.line((0, y, work_area_px - 1, y), fill=0, width=1)
+        # Vertical + horizontal lines: two strided writes, not one draw.line each
+        grid = np.ones((work_area_px, work_area_px), dtype=bool)
+        grid[::grid_spacing_px, :] = False
+        grid[:, ::grid_spacing_px] = False
 
         # Thicker border
-        draw.rectangle((0, 0, work_area_px - 1, work_area_px - 1), outline=0, width=2)
-        return img
+        PatternService.outline(grid, (0, 0, work_area_px - 1, work_area_px - 1), width=2)
+        return Image.fromarray(grid)
 
     @staticmethod
     def _bottom_test(mm_to_px) -> Image.Image:
@@ -126,11 +199,18 @@ class PatternService:
             resolution: mm per pixel (default 0.05)
             
         Returns:
-            Tuple of (PIL Image mode "1", metadata dict with center_x, center_y)
+            Tuple of (PIL Image mode "1", metadata dict with center_x, center_y).
+            The image is cached and shared (do not mutate); metadata is a
+            fresh dict callers may extend.
         """
-        def mm_to_px(mm: float) -> int:
-            return int(round(mm / resolution))
-        
+        img, metadata = PatternService._alignment(width_mm, height_mm, resolution)
+        return img, dict(metadata)
+
+    @staticmethod
+    @lru_cache(maxsize=PATTERN_CACHE_MAX)
+    def _alignment(
+        width_mm: float, height_mm: float, resolution: float
+    ) -> tuple[Image.Image, dict]:
         # Validate dimensions
         max_width_mm = 80.0
         max_height_mm = 76.0
@@ -140,8 +220,8 @@ class PatternService:
                 f"(max {max_width_mm}×{max_height_mm}mm)"
             )
         
-        width_px = mm_to_px(width_mm)
-        height_px = mm_to_px(height_mm)
+        width_px = _mm_to_px(width_mm, resolution)
+        height_px = _mm_to_px(height_mm, resolution)
         
         # Add margin for corner marks outside object boundary
         cross_size = 30  # 1.5mm at 0.05mm/px
@@ -159,7 +239,7 @@ class PatternService:
         box_top = canvas_margin
         box_right = canvas_margin + width_px - 1
         box_bottom = canvas_margin + height_px - 1
-        draw.rectangle((box_left, box_top, box_right, box_bottom), outline=0, width=2)
+        PatternService._paste_outline(img, (box_left, box_top, box_right, box_bottom), width=2)
         
         # Corner crosses (OUTSIDE boundary, visible for alignment)
         # Top-left
@@ -212,36 +292,43 @@ class PatternService:
             resolution: mm per pixel (default 0.05)
             
         Returns:
-            Tuple of (PIL Image mode "1", metadata dict)
+            Tuple of (PIL Image mode "1", metadata dict). The image is cached
+            and shared (do not mutate); metadata is a fresh dict.
         """
-        def mm_to_px(mm: float) -> int:
-            return int(round(mm / resolution))
-        
-        burn_width_px = mm_to_px(burn_width_mm)
-        burn_height_px = mm_to_px(burn_height_mm)
-        card_width_px = mm_to_px(card_width_mm)
+        img, metadata = PatternService._card_alignment(
+            burn_width_mm, burn_height_mm, card_width_mm, resolution
+        )
+        return img, dict(metadata)
+
+    @staticmethod
+    @lru_cache(maxsize=PATTERN_CACHE_MAX)
+    def _card_alignment(burn_width_mm: float, burn_height_mm: float,
+                        card_width_mm: float, resolution: float) -> tuple[Image.Image, dict]:
+        burn_width_px = _mm_to_px(burn_width_mm, resolution)
+        burn_height_px = _mm_to_px(burn_height_mm, resolution)
+        card_width_px = _mm_to_px(card_width_mm, resolution)
         
         # Calculate offset (burn area positioning on card)
         offset_right = (card_width_px - burn_width_px) // 2
         
-        # Canvas dimensions (card size + left margin for crosses)
+        # Canvas dimensions (card size + margin for crosses; also used top/bottom)
         cross_size = 30
         margin = 5
-        left_margin = cross_size + margin
+        canvas_margin = cross_size + margin
         
-        canvas_width = card_width_px + left_margin
-        canvas_height = burn_height_px + (2 * (cross_size + margin))
+        canvas_width = card_width_px + canvas_margin
+        canvas_height = burn_height_px + (2 * canvas_margin)
         img = Image.new("1", (canvas_width, canvas_height), 1)
         draw = ImageDraw.Draw(img)
         
-        # Burn area boundary (offset from left by left_margin + offset_right)
-        burn_left = left_margin + offset_right
-        burn_top = cross_size + margin
+        # Burn area boundary (offset from left by canvas_margin + offset_right)
+        burn_left = canvas_margin + offset_right
+        burn_top = canvas_margin
         burn_right = burn_left + burn_width_px - 1
         burn_bottom = burn_top + burn_height_px - 1
         
         # Card left edge (positioning reference)
-        card_left = left_margin
+        card_left = canvas_margin
         draw.line([(card_left, burn_top), (card_left, burn_bottom)], fill=0, width=2)
         
         # Burn area markers: top and bottom edges only
@@ -21,15 +21,75 @@ from utils.timestamps import file_timestamp, iso_timestamp
 logger = logging.getLogger(__name__)
 
 
+def _popcount(packed: np.ndarray) -> int:
+    """Count set bits in a packed uint8 array without unpacking it.
+
+    SWAR bit count over 32-bit words (native width on the Pi's ARMv6), so
+    it reads 1/8 of the data an unpackbits + count_nonzero pass would.
+    """
+    flat = packed.ravel()
+    if flat.size % 4:
+        flat = np.concatenate((flat, np.zeros(-flat.size % 4, dtype=np.uint8)))
+    words = flat.view(np.uint32)
+    words = words - ((words >> 1) & 0x55555555)
+    words = (words & 0x33333333) + ((words >> 2) & 0x33333333)
+    words = (words + (words >> 4)) & 0x0F0F0F0F
+    return int(((words * 0x01010101) >> 24).sum(dtype=np.int64))
+
+
 class PipelineService:
     """File-based pipeline for K6 laser workflow"""
 
+    @staticmethod
+    def pack_threshold(gray: np.ndarray, threshold: int = 128, invert: bool = False) -> np.ndarray:
+        """Threshold a grayscale array and pack 8 pixels per byte (MSB first).
+
+        One pass: compare -> packbits. Bit 1 = burn (pixel < threshold, or
+        >= threshold when inverted). packbits zero-fills the last byte, so
+        padding columns are skip (white) without an explicit np.pad.
+
+        Args:
+            gray: 2-D uint8 array (height, width)
+            threshold: Pixel threshold 0-255
+            invert: Swap burn/skip
+
+        Returns:
+            uint8 array (height, ceil(width / 8))
+        """
+        burn = gray >= threshold if invert else gray < threshold
+        return np.packbits(burn, axis=1, bitorder="big")
+
+    @staticmethod
+    def pack_1bit(img: Image.Image, invert: bool = False) -> np.ndarray:
+        """Pack a mode "1" image straight from its raster buffer.
+
+        PIL already stores 1-bit images MSB-first, rows padded to a byte,
+        with bit 1 = white. Flipping the bits gives burn bits without a
+        grayscale round trip or repack. Padding bits are forced to skip.
+
+        Args:
+            img: Mode "1" PIL image
+            invert: Swap burn/skip
+
+        Returns:
+            uint8 array (height, ceil(width / 8))
+        """
+        width, height = img.size
+        bytes_per_line = (width + 7) // 8
+        raw = np.frombuffer(img.tobytes(), dtype=np.uint8).reshape(height, bytes_per_line)
+        packed = raw.copy() if invert else np.bitwise_not(raw)
+        if width % 8:
+            packed[:, -1] &= (0xFF << (8 - width % 8)) & 0xFF
+        return packed
+
     @staticmethod
     def process_image(
-        input_path: str,
+        input_path: Optional[str],
         output_dir: Path,
         threshold: int = 128,
-        invert: bool = False
+        invert: bool = False,
+        image: Optional[Image.Image] = None,
+        write_preview: bool = True,
     ) -> Dict:
         """Process image to burn-ready format (Step 2).
 
@@ -44,6 +104,9 @@ class PipelineService:
                       pixels < threshold = black (burn)
                       pixels >= threshold = white (skip)
             invert: If True, invert black/white (burn white areas instead)
+            image: Already-rendered PIL image; skips re-opening input_path
+            write_preview: Render/save preview.png; burns that discard it skip
+                           this (preview_path is None)
 
         Returns:
             {
@@ -65,46 +128,33 @@ class PipelineService:
         # Validate threshold
         threshold = max(0, min(255, threshold))
 
-        # Load and convert to grayscale
-        img = Image.open(input_path).convert("L")
-        width, height = img.size
+        # Load (in-memory renders skip the file read)
+        if image is None:
+            image = Image.open(input_path)
+        width, height = image.size
 
         # Validate size
         if width > 1600 or height > 1600:
             raise ValueError(f"Image too large: {width}×{height} (max 1600×1600)")
 
-        # Convert to NumPy for fast processing
-        pixels = np.array(img, dtype=np.uint8)
-
-        # Threshold: 1=burn (black), 0=skip (white)
-        # Must match driver/protocol path where DATA bit=1 means laser ON.
-        binary = (pixels < threshold).astype(np.uint8)
-        
-        # Invert if requested (swap burn/skip)
-        if invert:
-            binary = 1 - binary
-
-        # Count pixels
-        black_pixels = int(np.sum(binary == 1))
-        white_pixels = int(np.sum(binary == 0))
-
-        # Pad width to 8px boundary for bit packing
+        # 1-bit renders (job/calibration/QR burns): pixels are 0 or 255, so any
+        # threshold > 0 maps black -> burn. Take the bits from the raster buffer.
         original_width = width
-        if width % 8 != 0:
-            pad_width = 8 - (width % 8)
-            binary = np.pad(
-                binary,
-                ((0, 0), (0, pad_width)),
-                mode="constant",
-                constant_values=0  # white (skip)
-            )
-            width = binary.shape[1]
-
-        # Pack 8 pixels per byte (MSB first)
-        packed_width = width // 8
-        packed = np.zeros((height, packed_width), dtype=np.uint8)
-        for bit in range(8):
-            packed |= binary[:, bit::8] << (7 - bit)
+        if image.mode == "1" and threshold > 0:
+            packed = PipelineService.pack_1bit(image, invert)
+        else:
+            img = image if image.mode == "L" else image.convert("L")
+            pixels = np.asarray(img, dtype=np.uint8)
+
+            # Threshold, invert and pack fused: one compare (invert flips the
+            # comparison) + packbits, which zero-fills (skip) the padding.
+            # Bit 1 = burn, matching the driver/protocol DATA bit = laser ON.
+            packed = PipelineService.pack_threshold(pixels, threshold, invert)
+
+        # Padding bits are skip (0), so they never count as burn
+        black_pixels = _popcount(packed)
+        white_pixels = original_width * height - black_pixels
+        width = packed.shape[1] * 8
 
         # Generate timestamp
         timestamp = file_timestamp()
@@ -114,9 +164,12 @@ class PipelineService:
         np.save(processed_path, packed)
 
         # Generate preview (1-bit visualization): burn bits as black pixels.
-        preview_img = Image.fromarray(((1 - binary) * 255).astype(np.uint8), mode="L")
-        preview_path = output_dir / f"processed_{timestamp}.png"
-        preview_img.save(preview_path)
+        preview_path = None
+        if write_preview:
+            binary = np.unpackbits(packed, axis=1)  # padded width
+            preview_img = Image.fromarray(((1 - binary) * 255).astype(np.uint8), mode="L")
+            preview_path = output_dir / f"processed_{timestamp}.png"
+            preview_img.save(preview_path)
 
         # Stats
         total_pixels = black_pixels + white_pixels
@@ -124,7 +177,7 @@ class PipelineService:
         logger.info(
             "Pipeline process_image: %s | %dx%d -> padded_w=%d | "
             "threshold=%d invert=%s | black_pixels=%d white_pixels=%d burn_pct=%.2f | polarity=black->burn",
-            input_path,
+            input_path or "<in-memory>",
             original_width,
             height,
             width,
@@ -137,7 +190,7 @@ class PipelineService:
 
         return {
             "processed_path": str(processed_path),
-            "preview_path": str(preview_path),
+            "preview_path": str(preview_path) if preview_path else None,
             "width": original_width,
             "height": height,
             "stats": {
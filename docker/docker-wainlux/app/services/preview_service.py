@@ -9,12 +9,13 @@ Renders visual previews for all pipeline stages:
 Used by single-step mode for visual debugging.
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 from pathlib import Path
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 import logging
 from constants import K6Constants
+from utils import load_font, DEJAVU_SANS
 
 logger = logging.getLogger(__name__)
 
@@ -130,10 +131,7 @@ class PreviewService:
         )
         
         # Label OUTSIDE burn area (top-left, above border)
-        try:
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 14)
-        except (OSError, IOError):
-            font = ImageFont.load_default()
+        font = load_font(DEJAVU_SANS, 14)
         
         label = f"Burn Area ({K6Constants.BURN_WIDTH_MM}×{K6Constants.BURN_HEIGHT_MM} mm)"
         draw.text((ref_x1, ref_y1 - 20), label, fill=PreviewService.COLOR_BURN_BORDER, font=font)
@@ -190,10 +188,7 @@ class PreviewService:
                                         PreviewService.COLOR_MATERIAL, width=2)
         
         # Label
-        try:
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 14)
-        except (OSError, IOError):
-            font = ImageFont.load_default()
+        font = load_font(DEJAVU_SANS, 14)
         
         shape = material.get("shape", "Custom")
         label = f"{shape} ({width_mm:.1f}×{height_mm:.1f} mm)"
@@ -483,10 +478,7 @@ class PreviewService:
     @staticmethod
     def _draw_annotations(draw: ImageDraw.Draw, annotations: List[dict]):
         """Draw annotation text on preview"""
-        try:
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 16)
-        except (OSError, IOError):
-            font = ImageFont.load_default()
+        font = load_font(DEJAVU_SANS, 16)
         
         # Position annotations in top-right corner
         x = PreviewService.CANVAS_WIDTH - 400
@@ -4,7 +4,8 @@ import qrcode
 import io
 import base64
 import logging
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
+from utils import load_font, text_bbox, DEJAVU_SANS, DEJAVU_SANS_BOLD
 
 logger = logging.getLogger(__name__)
 
@@ -53,26 +54,12 @@ class QRService:
 
         # Load fonts - sizes for readability at 0.05mm/px
         # 60px = 3mm, 40px = 2mm
-        try:
-            font_large = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 60
-            )
-            font_small = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 40
-            )
-        except (OSError, IOError):
-            logger.warning("DejaVu fonts missing; falling back to default.")
-            font_large = ImageFont.load_default()
-            font_small = ImageFont.load_default()
+        font_large = load_font(DEJAVU_SANS_BOLD, 60)
+        font_small = load_font(DEJAVU_SANS, 40)
 
         # Measure text to calculate canvas size
         ssid_text = f"SSID: {ssid}"
-        
-        # Create temporary draw context for measurement
-        temp_img = Image.new("RGB", (1, 1), "white")
-        temp_draw = ImageDraw.Draw(temp_img)
-        
-        ssid_bbox = temp_draw.textbbox((0, 0), ssid_text, font=font_large)
+        ssid_bbox = text_bbox(DEJAVU_SANS_BOLD, 60, ssid_text)
         ssid_w = ssid_bbox[2] - ssid_bbox[0]
         ssid_h = ssid_bbox[3] - ssid_bbox[1]
 
@@ -82,14 +69,14 @@ class QRService:
         pwd_text = ""
         if show_password and password:
             pwd_text = f"Password: {password}"
-            pwd_bbox = temp_draw.textbbox((0, 0), pwd_text, font=font_small)
+            pwd_bbox = text_bbox(DEJAVU_SANS, 40, pwd_text)
             pwd_w = pwd_bbox[2] - pwd_bbox[0]
             pwd_h = pwd_bbox[3] - pwd_bbox[1]
 
         desc_w = 0
         desc_h = 0
         if description:
-            desc_bbox = temp_draw.textbbox((0, 0), description, font=font_small)
+            desc_bbox = text_bbox(DEJAVU_SANS, 40, description)
             desc_w = desc_bbox[2] - desc_bbox[0]
             desc_h = desc_bbox[3] - desc_bbox[1]
 
@@ -188,15 +175,10 @@ class QRService:
             draw.line([(x, y - corner_size), (x, y + corner_size)], fill="black", width=2)
 
         # Label
-        try:
-            font = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 24
-            )
-        except (OSError, IOError):
-            font = ImageFont.load_default()
+        font = load_font(DEJAVU_SANS, 24)
 
         label = "K6 Burn Area (75 × 53.98 mm)"
-        bbox = draw.textbbox((0, 0), label, font=font)
+        bbox = text_bbox(DEJAVU_SANS, 24, label)
         text_width = bbox[2] - bbox[0]
         draw.text(
             ((QRService.BURN_WIDTH - text_width) // 2, QRService.BURN_HEIGHT // 2 - 12),
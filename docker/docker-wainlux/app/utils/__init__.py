@@ -2,5 +2,16 @@
 
 from .validators import safe_int, safe_float, parse_bool
 from .timestamps import file_timestamp, iso_timestamp
+from .fonts import load_font, text_bbox, DEJAVU_SANS, DEJAVU_SANS_BOLD
 
-__all__ = ['safe_int', 'safe_float', 'parse_bool', 'file_timestamp', 'iso_timestamp']
+__all__ = [
+    'safe_int',
+    'safe_float',
+    'parse_bool',
+    'file_timestamp',
+    'iso_timestamp',
+    'load_font',
+    'text_bbox',
+    'DEJAVU_SANS',
+    'DEJAVU_SANS_BOLD',
+]
@@ -0,0 +1,45 @@
+"""Font loading utilities (cached across requests)."""
+
+import logging
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFont
+
+logger = logging.getLogger(__name__)
+
+DEJAVU_SANS = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+DEJAVU_SANS_BOLD = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+
+
+@lru_cache(maxsize=16)
+def load_font(path: str, size: int):
+    """Load a TrueType font once per (path, size), falling back to default.
+
+    Args:
+        path: Font file path
+        size: Font size in pixels
+
+    Returns:
+        FreeTypeFont, or Pillow's default font if the file cannot be loaded
+    """
+    try:
+        return ImageFont.truetype(path, size)
+    except (OSError, IOError):
+        logger.warning(f"Font {path} missing; falling back to default.")
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=64)
+def text_bbox(path: str, size: int, text: str) -> tuple[int, int, int, int]:
+    """Measure text once per (path, size, text) with the cached font.
+
+    Args:
+        path: Font file path
+        size: Font size in pixels
+        text: Text to measure
+
+    Returns:
+        (left, top, right, bottom) as from ImageDraw.textbbox at (0, 0)
+    """
+    draw = ImageDraw.Draw(Image.new("L", (1, 1)))
+    return draw.textbbox((0, 0), text, font=load_font(path, size))
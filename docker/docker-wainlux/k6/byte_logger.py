@@ -12,6 +12,7 @@ Used for:
 
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Optional
 
 
 class ByteDumpLogger:
@@ -45,14 +46,16 @@ class ByteDumpLogger:
         self.text_file.write("=" * 70 + "\n\n")
         self.text_file.flush()
 
-    def log_send(self, data: bytes, description: str = ""):
+    def log_send(self, data: bytes, description: str = "", timestamp: Optional[str] = None):
         """Log outgoing bytes to device.
         
         Args:
             data: Bytes sent to device
             description: Optional description (e.g. "FRAMING", "DATA chunk 5/100")
+            timestamp: When the bytes were sent (ISO-8601); defaults to now.
+                       Deferred writers pass the time captured at send.
         """
-        timestamp = self._iso_timestamp()
+        timestamp = timestamp or self._iso_timestamp()
         
         # Binary dump
         self.binary_file.write(b">>> SEND " + data + b"\n")
@@ -81,16 +84,17 @@ class ByteDumpLogger:
         self.text_file.write("\n\n")
         self.text_file.flush()
 
-    def log_recv(self, data: bytes):
+    def log_recv(self, data: bytes, timestamp: Optional[str] = None):
         """Log incoming bytes from device.
         
         Args:
             data: Bytes received from device
+            timestamp: When the bytes were received (ISO-8601); defaults to now
         """
         if not data:
             return
             
-        timestamp = self._iso_timestamp()
+        timestamp = timestamp or self._iso_timestamp()
         
         # Binary dump
         self.binary_file.write(b"<<< RECV " + data + b"\n")
@@ -130,13 +134,14 @@ class ByteDumpLogger:
         self.text_file.write("\n")
         self.text_file.flush()
 
-    def log_error(self, message: str):
+    def log_error(self, message: str, timestamp: Optional[str] = None):
         """Log error message.
         
         Args:
             message: Error description
+            timestamp: When the error occurred (ISO-8601); defaults to now
         """
-        timestamp = self._iso_timestamp()
+        timestamp = timestamp or self._iso_timestamp()
         self.text_file.write(f"[{timestamp}] ERROR: {message}\n\n")
         self.text_file.flush()
 
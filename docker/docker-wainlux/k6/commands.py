@@ -250,6 +250,8 @@ class K6CommandBuilder:
     def build_data_packet(cls, payload: bytes, line_num: int = 0) -> K6Command:
         """Build DATA (0x22) packet for raster line data.
         
+        Accepts any bytes-like payload (bytes, memoryview row slices).
+        
         Layout:
           0: opcode 0x22
           1-2: length (big-endian)
@@ -108,7 +108,7 @@ class WainluxK6:
             protocol.send_cmd_checked(
                 transport,
                 "FRAMING",
-                bytes([0x21, 0x00, 0x04, 0x00]),
+                protocol.CMD_FRAMING_STOP,
                 timeout=1.0,
                 expect_ack=True,
                 csv_logger=csv_logger,
@@ -146,7 +146,7 @@ class WainluxK6:
                 protocol.send_cmd_checked(
                     transport,
                     f"CONNECT #{i+1}",
-                    bytes([0x0A, 0x00, 0x04, 0x00]),
+                    protocol.CMD_CONNECT,
                     timeout=1.0,
                     expect_ack=True,
                     csv_logger=csv_logger,
@@ -159,7 +159,7 @@ class WainluxK6:
             )
 
             # INIT x2
-            init_cmd = bytes([0x24, 0x00, 0x0B, 0x00] + [0x00] * 7)
+            init_cmd = protocol.CMD_INIT
             for i in range(2):
                 protocol.send_cmd_checked(
                     transport,
@@ -201,7 +201,7 @@ class WainluxK6:
         # STOP (best-effort) - write STOP and do not read replies to avoid
         # consuming subsequent responses (like VERSION) during transient states.
         try:
-            transport.write(bytes([0x16, 0x00, 0x04, 0x00]))
+            transport.write(protocol.CMD_STOP)
         except Exception:
             # ignore write failures; proceed with init
             pass
@@ -210,7 +210,7 @@ class WainluxK6:
         rx = protocol.send_cmd(
             transport,
             "VERSION",
-            bytes([0xFF, 0x00, 0x04, 0x00]),
+            protocol.CMD_VERSION,
             timeout=1.0,
             expect_ack=False,
             min_response_len=3,
@@ -227,7 +227,7 @@ class WainluxK6:
         protocol.send_cmd_checked(
             transport,
             "CONNECT #1",
-            bytes([0x0A, 0x00, 0x04, 0x00]),
+            protocol.CMD_CONNECT,
             timeout=1.0,
             expect_ack=True,
             csv_logger=csv_logger,
@@ -236,7 +236,7 @@ class WainluxK6:
         protocol.send_cmd_checked(
             transport,
             "CONNECT #2",
-            bytes([0x0A, 0x00, 0x04, 0x00]),
+            protocol.CMD_CONNECT,
             timeout=1.0,
             expect_ack=True,
             csv_logger=csv_logger,
@@ -247,7 +247,7 @@ class WainluxK6:
         protocol.send_cmd_checked(
             transport,
             "HOME",
-            bytes([0x17, 0x00, 0x04, 0x00]),
+            protocol.CMD_HOME,
             timeout=10.0,
             expect_ack=True,
             csv_logger=csv_logger,
@@ -443,7 +443,7 @@ class WainluxK6:
         protocol.send_cmd_checked(
             transport,
             "FRAMING",
-            bytes([0x21, 0x00, 0x04, 0x00]),
+            protocol.CMD_FRAMING_STOP,
             timeout=1.0,
             expect_ack=True,
             csv_logger=csv_logger,
@@ -480,7 +480,7 @@ class WainluxK6:
         protocol.send_cmd_checked(
             transport,
             "CONNECT #1",
-            bytes([0x0A, 0x00, 0x04, 0x00]),
+            protocol.CMD_CONNECT,
             timeout=1.0,
             expect_ack=True,
             csv_logger=csv_logger,
@@ -490,7 +490,7 @@ class WainluxK6:
         protocol.send_cmd_checked(
             transport,
             "CONNECT #2",
-            bytes([0x0A, 0x00, 0x04, 0x00]),
+            protocol.CMD_CONNECT,
             timeout=1.0,
             expect_ack=True,
             csv_logger=csv_logger,
@@ -526,7 +526,7 @@ class WainluxK6:
 
         # INIT x2 after burn (vendor-style pacing: 200ms then 500ms).
         time.sleep(0.2)
-        init_cmd = bytes([0x24, 0x00, 0x0B, 0x00] + [0x00] * 7)
+        init_cmd = protocol.CMD_INIT
         protocol.send_cmd_checked(
             transport,
             "INIT #1",
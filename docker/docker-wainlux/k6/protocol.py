@@ -14,6 +14,16 @@ HEARTBEAT = b"\xff\xff\xff\xfe"
 STATUS_PREFIX = b"\xff\xff\x00"
 DATA_CHUNK = 1900
 
+# Fixed control frames (opcode, 0x00, length LE), built once at import
+CMD_CROSSHAIR_ON = b"\x06\x00\x04\x00"
+CMD_CROSSHAIR_OFF = b"\x07\x00\x04\x00"
+CMD_CONNECT = b"\x0a\x00\x04\x00"
+CMD_STOP = b"\x16\x00\x04\x00"
+CMD_HOME = b"\x17\x00\x04\x00"
+CMD_FRAMING_STOP = b"\x21\x00\x04\x00"
+CMD_INIT = b"\x24\x00\x0b\x00" + bytes(7)
+CMD_VERSION = b"\xff\x00\x04\x00"
+
 
 def checksum(packet: bytes) -> int:
     """Two's complement (8-bit) checksum matching observed behavior.
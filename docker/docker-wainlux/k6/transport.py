@@ -14,6 +14,10 @@ class TransportBase:
     def read(self, size: int = 1) -> bytes:
         raise NotImplementedError
 
+    @property
+    def in_waiting(self) -> int:  # bytes readable without blocking
+        raise NotImplementedError
+
     def set_timeout(self, timeout: float):
         raise NotImplementedError
 
@@ -41,6 +45,10 @@ class SerialTransport(TransportBase):
     def read(self, size: int = 1) -> bytes:
         return self._ser.read(size)
 
+    @property
+    def in_waiting(self) -> int:
+        return self._ser.in_waiting
+
     def set_timeout(self, timeout: float):
         self._ser.timeout = timeout
 
@@ -112,6 +120,10 @@ class MockTransport(TransportBase):
         del self._resp[:size]
         return out
 
+    @property
+    def in_waiting(self) -> int:
+        return len(self._resp)
+
     def set_timeout(self, timeout: float):
         self._timeout = timeout
 